@@ -13,7 +13,9 @@ from difflib import SequenceMatcher
 from decimal import Decimal
 import re
 from .utils import retry_with_exponential_backoff, normalize_string, normalize_list, fuzzy_ratio
-from typing import Dict, List, Any, Optional
+# extract_volume_number moved to utils.py; re-exported here for backwards compatibility
+from .utils import extract_volume_number
+from typing import Dict, List, Any, NamedTuple, Optional
 
 # Global rate limit state
 _last_api_call = 0
@@ -27,6 +29,15 @@ _cache_ttl = 24 * 60 * 60  # 24 hours in seconds
 # Language filtering
 _default_language = "english"  # default language for filtering results
 
+# Author credits for illustrators, translators, editors and other non-primary contributors
+# (matched anywhere in the name, case-insensitively)
+_NON_PRIMARY_AUTHOR_RE = re.compile(
+    r'illustrator|translator|translated by|editor|edited by|foreword|afterword|'
+    r'introduction|preface|contributor|adapter|adaptor|compiler|compiled by|'
+    r'cover designer|cover artist|commentary|annotated by|revised by|reviser',
+    re.IGNORECASE
+)
+
 def set_audible_rate_limit(calls_per_minute: int) -> None:
     """
     Configure the rate limiting for Audible API calls.
@@ -510,14 +521,16 @@ def search_audible_parallel(query: str, search_field: str = "title", max_pages:
             search_audible_async(query, search_field, max_pages, results_per_page)
         )
 
-def narrator_match(narrators_result, narrators_wanted):
-    """Check if any narrator in the result matches any in the wanted list"""
+def narrator_match(narrators_result, narrators_wanted, norm_wanted=None):
+    """Check if any narrator in the result matches any in the wanted list
+    (norm_wanted: normalize_list(narrators_wanted), if the caller already has it)"""
     if not narrators_result or not narrators_wanted:
         return False
     
     # Normalize both lists
     norm_result = normalize_list(narrators_result)
-    norm_wanted = normalize_list(narrators_wanted)
+    if norm_wanted is None:
+        norm_wanted = normalize_list(narrators_wanted)
     
     # If either list is empty after normalization, return False
     if not norm_result or not norm_wanted:
@@ -535,7 +548,46 @@ def narrator_match(narrators_result, narrators_wanted):
     
     return False
 
-def confidence(result, wanted):
+class WantedNorm(NamedTuple):
+    """The wanted-side inputs of confidence(), normalized once per wanted book"""
+    title: str
+    series: str
+    author: str
+    publisher: str
+    narrators: list
+    norm_title: str
+    norm_series: str
+    norm_author: str
+    norm_publisher: str
+    norm_narrators: list
+    title_key: str
+    volume: Optional[Decimal]
+
+def normalize_wanted(wanted: Dict[str, Any]) -> WantedNorm:
+    """
+    Precompute the normalized wanted fields used by confidence()
+    
+    Hoist this out of loops that score many results against the same wanted book.
+    """
+    title = wanted.get('title', '')
+    series = wanted.get('series', '')
+    author = wanted.get('author', '')
+    publisher = wanted.get('publisher', '')
+    narrators = wanted.get('narrator', [])
+    return WantedNorm(
+        title, series, author, publisher, narrators,
+        normalize_string(title), normalize_string(series), normalize_string(author),
+        normalize_string(publisher), normalize_list(narrators),
+        get_title_volume_key(title), extract_volume_number(title),
+    )
+
+def _wanted_ratio(value: str, wanted_value: str, norm_wanted_value: str) -> float:
+    """fuzzy_ratio(value, wanted_value) using the already-normalized wanted string"""
+    if not value or not wanted_value:
+        return 0.0
+    return SequenceMatcher(None, normalize_string(value), norm_wanted_value).ratio()
+
+def confidence(result, wanted, wanted_norm: Optional[WantedNorm] = None):
     """
     Calculate a confidence score for how well a search result matches wanted criteria
     
@@ -555,10 +607,14 @@ def confidence(result, wanted):
     Args:
         result: Dictionary containing audiobook data from Audible API
         wanted: Dictionary containing the desired audiobook criteria
+        wanted_norm: normalize_wanted(wanted), to reuse across many results
         
     Returns:
         float: Confidence score between 0 and 1+ (can exceed 1.0 with bonuses)
     """
+    if wanted_norm is None:
+        wanted_norm = normalize_wanted(wanted)
+    
     # Define core weights (must sum to 1.0)
     core_weights = {
         'title': 0.5,   # Increased from 0.4
@@ -593,20 +649,20 @@ def confidence(result, wanted):
     
     # Extract volume information early for volume-aware matching
     result_volume = extract_volume_number(result['title'])
-    wanted_volume = extract_volume_number(wanted.get('title', ''))
+    wanted_volume = wanted_norm.volume
     
     # Title matching - use volume-aware normalization for series books
     norm_title_result = normalize_string(result['title'])
-    norm_title_wanted = normalize_string(wanted.get('title', ''))
+    norm_title_wanted = wanted_norm.norm_title
     
     # For series books, compare base titles without volume numbers
     result_series = result.get('series', '')
-    wanted_series = wanted.get('series', '')
+    wanted_series = wanted_norm.series
     
-    if result_series and wanted_series and normalize_string(result_series) == normalize_string(wanted_series):
+    if result_series and wanted_series and normalize_string(result_series) == wanted_norm.norm_series:
         # Same series - use volume-aware title matching
         result_base_title = get_title_volume_key(result['title'])
-        wanted_base_title = get_title_volume_key(wanted.get('title', ''))
+        wanted_base_title = wanted_norm.title_key
         
         if result_base_title == wanted_base_title:
             # Same base title (series match) - give high score
@@ -628,7 +684,7 @@ def confidence(result, wanted):
                 log_parts.append(f"Has volume info: {result_volume}")
         else:
             # Different base titles in same series
-            title_ratio = fuzzy_ratio(result['title'], wanted.get('title', ''))
+            title_ratio = _wanted_ratio(result['title'], wanted_norm.title, norm_title_wanted)
             if title_ratio >= thresholds['title']['high']:
                 score += core_weights['title'] * credit['high']
                 log_parts.append(f"Fuzzy series title match: '{result_base_title}' ~ '{wanted_base_title}' ({title_ratio:.2f})")
@@ -637,7 +693,7 @@ def confidence(result, wanted):
                 log_parts.append(f"Partial series title match: '{result_base_title}' ~ '{wanted_base_title}' ({title_ratio:.2f})")
     else:
         # Regular title matching for non-series or different series
-        title_ratio = fuzzy_ratio(result['title'], wanted.get('title', ''))
+        title_ratio = _wanted_ratio(result['title'], wanted_norm.title, norm_title_wanted)
         
         if norm_title_result and norm_title_wanted:
             if norm_title_result == norm_title_wanted:
@@ -653,8 +709,8 @@ def confidence(result, wanted):
     
     # Series matching
     norm_series_result = normalize_string(result['series'])
-    norm_series_wanted = normalize_string(wanted.get('series', ''))
-    series_ratio = fuzzy_ratio(result['series'], wanted.get('series', ''))
+    norm_series_wanted = wanted_norm.norm_series
+    series_ratio = _wanted_ratio(result['series'], wanted_series, norm_series_wanted)
     
     if norm_series_result and norm_series_wanted:
         if norm_series_result == norm_series_wanted:
@@ -670,15 +726,15 @@ def confidence(result, wanted):
     
     # Author matching - handle multiple authors
     norm_author_result = normalize_string(result['author'])
-    norm_author_wanted = normalize_string(wanted.get('author', ''))
+    norm_author_wanted = wanted_norm.norm_author
     
     # Check if any author in the result matches the wanted author
     result_authors = [a.strip() for a in result['author'].split(',') if a.strip()]
-    wanted_author = wanted.get('author', '')
+    wanted_author = wanted_norm.author
     
     best_author_ratio = 0.0
     for res_author in result_authors:
-        ratio = fuzzy_ratio(res_author, wanted_author)
+        ratio = _wanted_ratio(res_author, wanted_author, norm_author_wanted)
         best_author_ratio = max(best_author_ratio, ratio)
     
     if norm_author_result and norm_author_wanted:
@@ -695,21 +751,21 @@ def confidence(result, wanted):
     
     # Publisher matching (BONUS - only adds, never subtracts)
     norm_publisher_result = normalize_string(result['publisher'])
-    norm_publisher_wanted = normalize_string(wanted.get('publisher', ''))
+    norm_publisher_wanted = wanted_norm.norm_publisher
     
     if norm_publisher_result and norm_publisher_wanted:
         if (norm_publisher_wanted in norm_publisher_result or 
             norm_publisher_result in norm_publisher_wanted or 
-            fuzzy_ratio(result['publisher'], wanted.get('publisher', '')) >= 0.8):
+            _wanted_ratio(result['publisher'], wanted_norm.publisher, norm_publisher_wanted) >= 0.8):
             score += bonus_weights['publisher']
             log_parts.append(f"Publisher bonus: '{norm_publisher_result}' matches '{norm_publisher_wanted}'")
     
     # Narrator matching (BONUS - only adds, never subtracts)
     narrators_result = [result['narrator']] if isinstance(result['narrator'], str) else (result['narrator'] or [])
-    narrators_wanted = wanted.get('narrator', [])
+    narrators_wanted = wanted_norm.narrators
     
     if narrators_wanted and narrators_result:
-        if narrator_match(narrators_result, narrators_wanted):
+        if narrator_match(narrators_result, narrators_wanted, wanted_norm.norm_narrators):
             score += bonus_weights['narrator']
             log_parts.append(f"Narrator bonus: matches found")
     
@@ -805,18 +861,7 @@ def _process_product(product: Dict[str, Any]) -> Dict[str, Any]:
     for author in product.get('authors', []):
         name = author.get('name', '')
         # Skip illustrators, translators, editors, and other non-primary authors
-        if name and not any(role in name.lower() for role in [
-            '- illustrator', 'illustrator', 
-            '- translator', 'translator', 'translated by',
-            '- editor', 'editor', 'edited by',
-            'foreword', 'afterword',
-            'introduction', 'preface',
-            'contributor', 'adapter', 'adaptor',
-            'compiler', 'compiled by',
-            'cover designer', 'cover artist',
-            'commentary', 'annotated by',
-            'revised by', 'reviser'
-        ]):
+        if name and not _NON_PRIMARY_AUTHOR_RE.search(name):
             authors.append(name)
     author_str = ', '.join(authors) if authors else ''
     
@@ -905,15 +950,19 @@ def _process_product(product: Dict[str, Any]) -> Dict[str, Any]:
         'image_url': image_url
     }
 
-def extract_volume_number(title: str) -> Optional[Decimal]:
-    """
-    Extract and normalize volume numbers from book titles with decimal support
-    
-    This function has been moved to utils.py for shared use.
-    Importing here for backwards compatibility.
-    """
-    from .utils import extract_volume_number as utils_extract_volume_number
-    return utils_extract_volume_number(title)
+# Volume suffixes stripped by get_title_volume_key, applied in order to the lowercased title
+_VOLUME_REMOVALS = tuple(re.compile(pattern) for pattern in (
+    r'\s*vol\.?\s*\d+.*$',           # Remove "Vol. 14" and everything after
+    r'\s*volume\s*\d+.*$',           # Remove "Volume 14" and everything after
+    r'\s*book\s*\d+.*$',             # Remove "Book 14" and everything after
+    r'\s*\d+\s*\(light novel\).*$',  # Remove "14 (Light Novel)" and after
+    r'\s*\d+\s*\(ln\).*$',           # Remove "14 (LN)" and after
+    r',\s*vol\.?\s*\d+.*$',          # Remove ", Vol. 14" and after
+    r':\s*volume\s*\d+.*$',          # Remove ": Volume 14" and after
+    r'\s+\d+$',                      # Remove " 14" at end
+))
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
 
 def get_title_volume_key(title: str) -> str:
     """
@@ -931,24 +980,13 @@ def get_title_volume_key(title: str) -> str:
     title_lower = title.lower().strip()
     
     # Remove common volume indicators and normalize
-    volume_removals = [
-        r'\s*vol\.?\s*\d+.*$',           # Remove "Vol. 14" and everything after
-        r'\s*volume\s*\d+.*$',           # Remove "Volume 14" and everything after  
-        r'\s*book\s*\d+.*$',             # Remove "Book 14" and everything after
-        r'\s*\d+\s*\(light novel\).*$',  # Remove "14 (Light Novel)" and after
-        r'\s*\d+\s*\(ln\).*$',           # Remove "14 (LN)" and after
-        r',\s*vol\.?\s*\d+.*$',          # Remove ", Vol. 14" and after
-        r':\s*volume\s*\d+.*$',          # Remove ": Volume 14" and after
-        r'\s+\d+$',                      # Remove " 14" at end
-    ]
-    
     normalized = title_lower
-    for pattern in volume_removals:
-        normalized = re.sub(pattern, '', normalized)
+    for pattern in _VOLUME_REMOVALS:
+        normalized = pattern.sub('', normalized)
     
     # Clean up extra spaces and punctuation
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-    normalized = re.sub(r'[^\w\s]', '', normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
+    normalized = _PUNCTUATION_RE.sub('', normalized)
     
     return normalized
 
@@ -971,9 +1009,10 @@ def find_best_match_with_review(results: List[Dict[str, Any]], wanted: Dict[str,
         return None
     
     # Score all results
+    wanted_norm = normalize_wanted(wanted)
     scored_results = []
     for result in results:
-        score = confidence(result, wanted)
+        score = confidence(result, wanted, wanted_norm)
         scored_results.append((score, result))
     
     # Sort by confidence score (highest first)
@@ -1021,9 +1060,10 @@ def find_all_good_matches(results: List[Dict[str, Any]], wanted: Dict[str, Any],
         return []
     
     # Score all results
+    wanted_norm = normalize_wanted(wanted)
     scored_results = []
     for result in results:
-        score = confidence(result, wanted)
+        score = confidence(result, wanted, wanted_norm)
         if score >= min_confidence:  # Only include results that meet minimum threshold
             result = result.copy()  # Create a copy to avoid modifying original
             result['confidence_score'] = score
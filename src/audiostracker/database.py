@@ -2,6 +2,8 @@ import sqlite3
 from contextlib import closing
 import os
 import json
+import threading
+from urllib.request import pathname2url
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -9,6 +11,15 @@ import logging
 
 DB_FILE = os.path.join(os.path.dirname(__file__), 'audiobooks.db')
 
+# Database files already switched to WAL by this process
+_WAL_ENABLED = set()
+
+# Database files whose schema init_db() has already brought up to date in this process
+_SCHEMA_READY = set()
+
+# Long-lived read-only connections, one per thread and database file
+_read_local = threading.local()
+
 def get_connection():
     """
     Get a connection to the SQLite database with improved settings for reliability.
@@ -16,12 +27,20 @@ def get_connection():
     Returns:
         sqlite3.Connection: A connection to the SQLite database
     """
-    conn = sqlite3.connect(DB_FILE, timeout=30)  # Add timeout to handle busy database
+    # uri=True lets DB_FILE be a "file:" URI (e.g. a shared in-memory database in tests);
+    # plain paths are opened as before
+    conn = sqlite3.connect(DB_FILE, timeout=30, uri=True)  # Add timeout to handle busy database
     
     # Set pragmas for better performance and reliability
-    conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for better concurrency
+    if DB_FILE not in _WAL_ENABLED:
+        # WAL mode is stored in the database file, so switching once per process is enough
+        conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for better concurrency
+        _WAL_ENABLED.add(DB_FILE)
     conn.execute("PRAGMA synchronous = NORMAL")  # Balance between safety and speed
     conn.execute("PRAGMA foreign_keys = ON")  # Enforce foreign key constraints
+    conn.execute("PRAGMA cache_size = -65536")  # Up to 64 MiB page cache (negative = KiB)
+    conn.execute("PRAGMA mmap_size = 268435456")  # Read pages through a 256 MiB memory map
+    conn.execute("PRAGMA temp_store = MEMORY")  # Keep sort/temp tables out of temp files
     
     # Enable extended error codes for better diagnostics
     conn.execute("PRAGMA locking_mode = NORMAL")
@@ -31,6 +50,35 @@ def get_connection():
     
     return conn
 
+def get_read_connection():
+    """
+    Get this thread's long-lived read-only connection to the SQLite database.
+    
+    The connection is opened on first use and then reused, so callers must not close it; the
+    schema is initialized once per process. WAL lets it read alongside get_connection() writers.
+    
+    Returns:
+        sqlite3.Connection: A read-only connection that returns plain tuples
+    """
+    conns = getattr(_read_local, "conns", None)
+    if conns is None:
+        conns = _read_local.conns = {}
+    conn = conns.get(DB_FILE)
+    if conn is None:
+        if DB_FILE not in _SCHEMA_READY:
+            # Only the first reader in the process may need to create tables; later threads
+            # opening their read connection must not take the write lock
+            init_db()
+            _SCHEMA_READY.add(DB_FILE)
+        uri = f"file:{pathname2url(os.path.abspath(DB_FILE))}?mode=ro"
+        # A larger statement cache keeps every constant query the web UI issues prepared
+        conn = sqlite3.connect(uri, uri=True, timeout=30, isolation_level=None, cached_statements=256)
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conns[DB_FILE] = conn
+    return conn
+
 def init_db():
     with get_connection() as conn:
         c = conn.cursor()
@@ -66,6 +114,8 @@ def init_db():
                 pass
         
         # Create indexes (some may fail if columns don't exist yet, that's ok)
+        c.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_release_order'")
+        needs_analyze = c.fetchone() is None
         try:
             c.execute('CREATE INDEX IF NOT EXISTS idx_author ON audiobooks(author)')
         except sqlite3.OperationalError:
@@ -75,13 +125,23 @@ def init_db():
         except sqlite3.OperationalError:
             pass
         try:
-            c.execute('CREATE INDEX IF NOT EXISTS idx_release ON audiobooks(release_date)')
+            # Serves the upcoming-releases filter and its ORDER BY without a separate sort;
+            # it also covers every release_date lookup the old idx_release handled
+            c.execute('CREATE INDEX IF NOT EXISTS idx_release_order ON audiobooks(release_date, author, series, series_number)')
+            c.execute('DROP INDEX IF EXISTS idx_release')
         except sqlite3.OperationalError:
             pass
         try:
             c.execute('CREATE INDEX IF NOT EXISTS idx_publisher_name ON audiobooks(publisher_name)')
         except sqlite3.OperationalError:
             pass
+        try:
+            c.execute('CREATE INDEX IF NOT EXISTS idx_last_checked ON audiobooks(last_checked)')
+        except sqlite3.OperationalError:
+            pass
+        if needs_analyze:
+            # Give the query planner statistics for the new indexes
+            c.execute('ANALYZE audiobooks')
         
         # Remove old status column if it exists (migration from old tracking system)
         try:
@@ -121,8 +181,9 @@ def init_db():
             # Recreate indexes
             c.execute('CREATE INDEX IF NOT EXISTS idx_author ON audiobooks(author)')
             c.execute('CREATE INDEX IF NOT EXISTS idx_series ON audiobooks(series, series_number)')
-            c.execute('CREATE INDEX IF NOT EXISTS idx_release ON audiobooks(release_date)')
+            c.execute('CREATE INDEX IF NOT EXISTS idx_release_order ON audiobooks(release_date, author, series, series_number)')
             c.execute('CREATE INDEX IF NOT EXISTS idx_publisher_name ON audiobooks(publisher_name)')
+            c.execute('CREATE INDEX IF NOT EXISTS idx_last_checked ON audiobooks(last_checked)')
             logging.info("Successfully removed status column and migrated data")
         except sqlite3.OperationalError:
             # Status column doesn't exist, we're good
@@ -11,6 +11,9 @@ from functools import wraps
 # Define a generic type for the return value
 T = TypeVar('T')
 
+# Release times are midnight in California; resolve the zone once rather than per event
+CA_TZ = pytz.timezone('America/Los_Angeles')
+
 def retry(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0, exceptions=(Exception,)) -> Callable:
     """
     Retry decorator with exponential backoff for improved reliability
@@ -93,12 +96,11 @@ class ICalExporter:
             description += f"Audible Link: https://www.audible.com/pd/{asin}\\n"
         
         # Parse release date and set to midnight California time
-        ca_tz = pytz.timezone('America/Los_Angeles')
         try:
             # Parse the release date
             release_dt = datetime.strptime(release_date, '%Y-%m-%d')
             # Set to midnight California time
-            ca_midnight = ca_tz.localize(release_dt.replace(hour=0, minute=0, second=0, microsecond=0))
+            ca_midnight = CA_TZ.localize(release_dt.replace(hour=0, minute=0, second=0, microsecond=0))
             # Convert to UTC for the iCal format
             utc_start = ca_midnight.astimezone(pytz.UTC)
             utc_end = utc_start + timedelta(hours=1)  # 1-hour event
@@ -110,7 +112,7 @@ class ICalExporter:
         except ValueError:
             # If date parsing fails, use today at midnight California time
             today = datetime.now()
-            ca_midnight = ca_tz.localize(today.replace(hour=0, minute=0, second=0, microsecond=0))
+            ca_midnight = CA_TZ.localize(today.replace(hour=0, minute=0, second=0, microsecond=0))
             utc_start = ca_midnight.astimezone(pytz.UTC)
             utc_end = utc_start + timedelta(hours=1)
             
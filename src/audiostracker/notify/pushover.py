@@ -3,6 +3,7 @@ import logging
 import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from ..utils import retry_with_exponential_backoff
 
 class PushoverNotifier:
     """Pushover notification implementation"""
@@ -80,6 +81,17 @@ class PushoverNotifier:
         
         return title, message, url
 
+    @retry_with_exponential_backoff(max_retries=3)
+    def _post_message(self, payload: Dict[str, Any]) -> requests.Response:
+        """POST a message to the Pushover API, retrying network and HTTP errors"""
+        response = requests.post(
+            self.PUSHOVER_API_URL,
+            data=payload,
+            timeout=10
+        )
+        response.raise_for_status()
+        return response
+
     def send_digest(self, audiobooks: List[Dict[str, Any]]) -> bool:
         """
         Send a digest notification for multiple audiobooks
@@ -115,13 +127,7 @@ class PushoverNotifier:
             
             logging.debug(f"Sending Pushover notification: {title}")
             
-            response = requests.post(
-                self.PUSHOVER_API_URL,
-                data=payload,
-                timeout=10
-            )
-            
-            response.raise_for_status()
+            response = self._post_message(payload)
             
             result = response.json()
             if result.get('status') == 1:
@@ -12,6 +12,12 @@ from typing import Callable, Any, Optional
 from decimal import Decimal
 import requests
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only have the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 class JsonFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
@@ -66,7 +72,7 @@ def merge_env_config(config):
 # Load YAML config
 def load_yaml(path):
     with open(path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlSafeLoader)
 
 # Load JSON config
 def load_json(path):
@@ -303,6 +309,18 @@ VOL_RE = re.compile(
     re.IGNORECASE | re.VERBOSE,
 )
 
+# Common volume patterns with decimal support, tried in order against the lowercased title
+VOLUME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'vol\.?\s*(\d+(?:\.\d+)?)',           # "Vol. 14", "Vol 14.5"
+    r'volume\s*(\d+(?:\.\d+)?)',           # "Volume 14", "Volume 14.5"
+    r'book\s*(\d+(?:\.\d+)?)',             # "Book 14", "Book 14.5"
+    r'(\d+(?:\.\d+)?)\s*\(light novel\)', # "14 (Light Novel)", "14.5 (Light Novel)"
+    r'(\d+(?:\.\d+)?)\s*\(ln\)',          # "14 (LN)", "14.5 (LN)"
+    r',\s*vol\.?\s*(\d+(?:\.\d+)?)',      # ", Vol. 14", ", Vol. 14.5"
+    r':\s*volume\s*(\d+(?:\.\d+)?)',      # ": Volume 14", ": Volume 14.5"
+    r'\s+(\d+(?:\.\d+)?)$',               # " 14" or " 14.5" at end of title
+))
+
 def extract_volume_number(title: str) -> Optional[Decimal]:
     """
     Extract and normalize volume numbers from book titles with decimal support
@@ -321,20 +339,8 @@ def extract_volume_number(title: str) -> Optional[Decimal]:
     
     title_lower = title.lower()
     
-    # Common volume patterns with decimal support
-    volume_patterns = [
-        r'vol\.?\s*(\d+(?:\.\d+)?)',           # "Vol. 14", "Vol 14.5"
-        r'volume\s*(\d+(?:\.\d+)?)',           # "Volume 14", "Volume 14.5"
-        r'book\s*(\d+(?:\.\d+)?)',             # "Book 14", "Book 14.5"
-        r'(\d+(?:\.\d+)?)\s*\(light novel\)', # "14 (Light Novel)", "14.5 (Light Novel)"
-        r'(\d+(?:\.\d+)?)\s*\(ln\)',          # "14 (LN)", "14.5 (LN)"
-        r',\s*vol\.?\s*(\d+(?:\.\d+)?)',      # ", Vol. 14", ", Vol. 14.5"
-        r':\s*volume\s*(\d+(?:\.\d+)?)',      # ": Volume 14", ": Volume 14.5"
-        r'\s+(\d+(?:\.\d+)?)$',               # " 14" or " 14.5" at end of title
-    ]
-    
-    for pattern in volume_patterns:
-        match = re.search(pattern, title_lower)
+    for pattern in VOLUME_PATTERNS:
+        match = pattern.search(title_lower)
         if match:
             try:
                 return Decimal(match.group(1))
@@ -5,25 +5,43 @@ A modern, modular web interface for managing new audiobook feeds.
 """
 
 from fastapi import FastAPI, HTTPException, Request, Form
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse, Response
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
 from pathlib import Path
-import json
+from contextlib import asynccontextmanager, suppress
+import orjson
 import logging
-from typing import Dict, List, Optional
-from pydantic import BaseModel, field_validator
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, field_validator
 import os
 import shutil
-from datetime import datetime
+import hashlib
+from datetime import date, datetime
 import yaml
 import sqlite3
 import sys
-import io
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from collections import Counter, defaultdict
+from functools import lru_cache
+from urllib.parse import unquote
+
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only have the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 # Add the parent directory to the path so we can import from audiostracker
 sys.path.append(str(Path(__file__).parent.parent))
-from database import get_connection, init_db
+import database
+from database import get_read_connection
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -47,7 +65,42 @@ except ImportError as e:
         ICalExporter = None
         ICAL_AVAILABLE = False
 
-def create_simple_ical_event(audiobook: dict) -> str:
+# Calendar header (including the VTIMEZONE block for America/Los_Angeles) and footer
+# shared by every single-event iCal download
+ICAL_HEADER = b"""BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Audiobook Stalkerr//Audiobook Stalkerr//EN
+CALSCALE:GREGORIAN
+METHOD:PUBLISH
+X-WR-CALNAME:Audiobook Stalkerr - New Releases
+X-WR-CALDESC:New audiobook releases tracked by Audiobook Stalkerr
+BEGIN:VTIMEZONE
+TZID:America/Los_Angeles
+BEGIN:DAYLIGHT
+TZOFFSETFROM:-0800
+TZOFFSETTO:-0700
+TZNAME:PDT
+DTSTART:19700308T020000
+RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU
+END:DAYLIGHT
+BEGIN:STANDARD
+TZOFFSETFROM:-0700
+TZOFFSETTO:-0800
+TZNAME:PST
+DTSTART:19701101T020000
+RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU
+END:STANDARD
+END:VTIMEZONE
+"""
+ICAL_FOOTER = b"END:VCALENDAR"
+# Fixed lines closing every VEVENT (the trailing empty string keeps the final newline)
+ICAL_EVENT_TRAILER = ("CATEGORIES:Audiobooks,Entertainment", "STATUS:CONFIRMED", "TRANSP:OPAQUE", "END:VEVENT", "")
+
+# Characters replaced with '_' in downloaded .ics filenames (spaces, path separators and
+# characters Windows rejects or that would break the quoted Content-Disposition value)
+ICAL_FILENAME_TABLE = str.maketrans(dict.fromkeys(' /\\:*?"<>|', '_'))
+
+def create_simple_ical_event(audiobook: dict) -> bytes:
     """Create a simple iCal event for an audiobook at 00:00 America/Los_Angeles"""
     title = audiobook.get('title', 'Unknown Title')
     author = audiobook.get('author', 'Unknown Author')
@@ -65,92 +118,98 @@ def create_simple_ical_event(audiobook: dict) -> str:
     elif series:
         event_title += f" ({series})"
     
-    # Create description
-    description = f"New audiobook release\\n\\n"
-    description += f"Title: {title}\\n"
-    description += f"Author: {author}\\n"
-    description += f"Narrator: {narrator}\\n"
-    description += f"Publisher: {publisher}\\n"
+    # Create description (lines are joined with an escaped iCal newline)
+    description_lines = [
+        "New audiobook release",
+        "",
+        f"Title: {title}",
+        f"Author: {author}",
+        f"Narrator: {narrator}",
+        f"Publisher: {publisher}",
+    ]
     if series:
-        description += f"Series: {series}"
-        if series_number:
-            description += f" (#{series_number})"
-        description += "\\n"
-    description += f"ASIN: {asin}\\n"
+        description_lines.append(f"Series: {series} (#{series_number})" if series_number else f"Series: {series}")
+    description_lines.append(f"ASIN: {asin}")
     if asin:
-        description += f"Audible Link: https://www.audible.com/pd/{asin}\\n"
+        description_lines.append(f"Audible Link: https://www.audible.com/pd/{asin}")
+    description = "\\n".join(description_lines) + "\\n"
     
-    # Parse release date and set to midnight California time
+    # Release at midnight California time; DTSTART carries TZID=America/Los_Angeles, so only
+    # the local wall-clock date is needed. Split the YYYY-MM-DD string directly (date() still
+    # rejects impossible dates) instead of going through strptime.
     try:
-        from datetime import datetime
-        import pytz
-        ca_tz = pytz.timezone('America/Los_Angeles')
-        release_dt = datetime.strptime(release_date, '%Y-%m-%d')
-        release_dt = ca_tz.localize(release_dt.replace(hour=0, minute=0, second=0, microsecond=0))
-        dtstart = release_dt.strftime('%Y%m%dT%H%M%S')
-        dtend = release_dt.strftime('%Y%m%dT%H%M%S')
-    except Exception:
-        from datetime import datetime
-        now = datetime.now()
-        dtstart = now.strftime('%Y%m%dT000000')
-        dtend = now.strftime('%Y%m%dT000000')
+        year, month, day = release_date.split('-')
+        release_day = date(int(year), int(month), int(day))
+    except (AttributeError, TypeError, ValueError):
+        release_day = date.today()
+    dtstart = dtend = f"{release_day.year:04d}{release_day.month:02d}{release_day.day:02d}T000000"
     
     # Generate unique ID
-    from datetime import datetime
-    uid = f"audiobook-{asin}-{datetime.now().strftime('%Y%m%d%H%M%S')}@audiobookstalkerr"
+    uid = f"audiobook-{asin}-{uuid.uuid4().hex}@audiobookstalkerr"
     
     # Create timestamp
-    timestamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+    timestamp = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())
     
-    # VTIMEZONE block for America/Los_Angeles
-    vtimezone = """BEGIN:VTIMEZONE
-TZID:America/Los_Angeles
-BEGIN:DAYLIGHT
-TZOFFSETFROM:-0800
-TZOFFSETTO:-0700
-TZNAME:PDT
-DTSTART:19700308T020000
-RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU
-END:DAYLIGHT
-BEGIN:STANDARD
-TZOFFSETFROM:-0700
-TZOFFSETTO:-0800
-TZNAME:PST
-DTSTART:19701101T020000
-RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU
-END:STANDARD
-END:VTIMEZONE"""
-    
-    ical_content = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Audiobook Stalkerr//Audiobook Stalkerr//EN
-CALSCALE:GREGORIAN
-METHOD:PUBLISH
-X-WR-CALNAME:Audiobook Stalkerr - New Releases
-X-WR-CALDESC:New audiobook releases tracked by Audiobook Stalkerr
-{vtimezone}
-BEGIN:VEVENT
-UID:{uid}
-DTSTART;TZID=America/Los_Angeles:{dtstart}
-DTEND;TZID=America/Los_Angeles:{dtend}
-DTSTAMP:{timestamp}
-SUMMARY:{event_title}
-DESCRIPTION:{description}
-CATEGORIES:Audiobooks,Entertainment
-STATUS:CONFIRMED
-TRANSP:OPAQUE
-END:VEVENT
-END:VCALENDAR"""
+    ical_event = "\n".join([
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTART;TZID=America/Los_Angeles:{dtstart}",
+        f"DTEND;TZID=America/Los_Angeles:{dtend}",
+        f"DTSTAMP:{timestamp}",
+        f"SUMMARY:{event_title}",
+        f"DESCRIPTION:{description}",
+        *ICAL_EVENT_TRAILER,
+    ])
     
-    return ical_content
+    return b"".join((ICAL_HEADER, ical_event.encode('utf-8'), ICAL_FOOTER))
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (fastapi.responses.ORJSONResponse is deprecated upstream)"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+class CachedStatic(StaticFiles):
+    """Static files with browser caching; versioned URLs (?v=...) are additionally marked immutable"""
+    max_age = 86400
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            cache_control = f"public, max-age={self.max_age}"
+            if b"v=" in scope.get("query_string", b""):
+                cache_control += ", immutable"
+            response.headers["Cache-Control"] = cache_control
+        return response
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the audiobooks write-behind flusher for the lifetime of the app"""
+    flusher = asyncio.create_task(_flush_loop())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+        # Don't lose edits that were still waiting for the flush delay
+        if _dirty.is_set():
+            await flush_audiobooks()
+        elif _save_in_flight is not None:
+            await _save_in_flight
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Audiobook Stalkerr Web UI",
     description="A modern web interface for managing audiobook collections",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Compress larger responses (collection listings, exports); small JSON goes out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Paths
 BASE_DIR = Path(__file__).parent
 STATIC_DIR = BASE_DIR / "static"
@@ -159,15 +218,60 @@ CONFIG_DIR = BASE_DIR.parent / "config"
 AUDIOBOOKS_FILE = CONFIG_DIR / "audiobooks.json"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# audiobooks.json backups: one snapshot per interval instead of one per save
+BACKUP_INTERVAL_SECONDS = 3600
+BACKUP_KEEP = 24
+_last_backup_time: Optional[float] = None
+
+# (blake2b digest of the bytes, (st_mtime_ns, st_size) of the file) from the last save
+_last_saved: Optional[tuple] = None
+
+# Write-behind buffer: routes read and mutate this in-memory copy of audiobooks.json and
+# mark it dirty; _flush_loop writes it back once edits have been quiet for FLUSH_DELAY_SECONDS
+# (at most FLUSH_MAX_DELAY_SECONDS after the first edit of a burst). Routes answer before the
+# write happens, so a failed write is reported by /api/stats through _FLUSH_STATE.
+# "file_key" is the (st_mtime_ns, st_size) of the file version the copy matches, so edits made
+# outside the web UI get picked up;
+# "stats" memoizes get_stats() for the current copy and is dropped whenever the data changes;
+# "index" holds the StatsIndex counters the stats are built from and is kept in step with edits.
+FLUSH_DELAY_SECONDS = 0.2
+FLUSH_MAX_DELAY_SECONDS = 2.0
+FLUSH_RETRY_SECONDS = 5.0
+_AUDIOBOOKS_CACHE: Dict[str, Any] = {"data": None, "file_key": None, "stats": None, "index": None,
+                                     "frontend": None, "author_pages": {}, "version": 0}
+_dirty = asyncio.Event()
+_reload_lock = asyncio.Lock()
+# "last_edit": time.monotonic() of the latest schedule_flush(); "failed_at": ISO time of the
+# last failed write, cleared by the next successful one
+_FLUSH_STATE: Dict[str, Any] = {"last_edit": 0.0, "failed_at": None}
+# The last save started by flush_audiobooks(); its worker thread keeps running even if the
+# flush that started it is cancelled, so the next flush waits for it
+_save_in_flight: Optional[asyncio.Future] = None
+
+# ETags embed a per-process token so versions from before a restart never match
+_ETAG_BOOT_ID = uuid.uuid4().hex[:8]
+
+# Analytics only change when the database does; key -> (_db_change_key() it was built for, result)
+_ANALYTICS_CACHE: Dict[str, tuple] = {}
+
+# Last rendered /api/upcoming array, reused while _db_change_key() is unchanged
+_UPCOMING_CACHE: Dict[str, Any] = {"key": None, "json": None}
+
 # Load configuration
+@lru_cache(maxsize=1)
+def _parse_config(file_key: tuple) -> dict:
+    """Parse config.yaml; file_key (mtime_ns, size) is only the cache key"""
+    with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=YamlSafeLoader) or {}
+    logger.info(f"Loaded configuration from {CONFIG_FILE}")
+    return config
+
 def load_config() -> dict:
-    """Load configuration from config.yaml"""
+    """Load configuration from config.yaml (re-parsed only when the file changes)"""
     try:
         if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                logger.info(f"Loaded configuration from {CONFIG_FILE}")
-                return config
+            st = CONFIG_FILE.stat()
+            return _parse_config((st.st_mtime_ns, st.st_size))
         else:
             logger.warning(f"Config file not found: {CONFIG_FILE}")
             return {}
@@ -185,13 +289,19 @@ WEB_PORT = web_config.get('port', 5005)
 WEB_RELOAD = web_config.get('reload', True)
 
 # Mount static files
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+app.mount("/static", CachedStatic(directory=str(STATIC_DIR)), name="static")
 
 # Jinja2 templates
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+if not WEB_RELOAD:
+    # Production: compile templates once and skip the per-render mtime check
+    templates.env.auto_reload = False
+    templates.env.bytecode_cache = FileSystemBytecodeCache()
 
 # Pydantic models for data validation
 class Audiobook(BaseModel):
+    model_config = ConfigDict(extra='ignore', str_strip_whitespace=True)
+
     title: str = ""
     series: str = ""
     publisher: str = ""
@@ -200,6 +310,9 @@ class Audiobook(BaseModel):
     @field_validator('narrator', mode='before')
     @classmethod
     def ensure_narrator_list(cls, v):
+        # Fast path: the frontend normally already sends a list
+        if type(v) is list:
+            return v
         if isinstance(v, str):
             return [v] if v else []
         return v or []
@@ -207,16 +320,30 @@ class Audiobook(BaseModel):
 class AuthorBooks(BaseModel):
     books: List[Audiobook]
 
+class AuthorCollection(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    author: Dict[str, List[Audiobook]]
+
 class AudiobookCollection(BaseModel):
-    audiobooks: Dict[str, Dict[str, List[Audiobook]]]
+    model_config = ConfigDict(extra='allow')
+
+    audiobooks: AuthorCollection
+
+class BatchOperation(BaseModel):
+    """One edit in a POST /api/audiobooks/batch request, mirroring the single-edit routes"""
+    op: Literal["add_author", "delete_author", "add_book", "update_book", "delete_book"]
+    author: str
+    index: Optional[int] = None
+    book: Optional[Audiobook] = None
 
 # Data management functions
 def load_audiobooks() -> dict:
     """Load audiobooks data from JSON file"""
     try:
         if AUDIOBOOKS_FILE.exists():
-            with open(AUDIOBOOKS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(AUDIOBOOKS_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
                 logger.info(f"Loaded audiobooks data from {AUDIOBOOKS_FILE}")
                 return data
         else:
@@ -229,139 +356,521 @@ def load_audiobooks() -> dict:
 def save_audiobooks(data: dict) -> bool:
     """Save audiobooks data to JSON file with backup"""
     try:
-        # Create backup
+        global _last_saved
+        content = encode_json_file(data)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        # Nothing to do if this is exactly what we last wrote and the file hasn't changed since
+        if _last_saved is not None and _last_saved == (digest, get_audiobooks_file_key()):
+            logger.debug("Audiobooks data unchanged, skipping save")
+            return True
+        
+        # Snapshot the previous version (rate limited, see rotate_backups)
         if AUDIOBOOKS_FILE.exists():
-            backup_path = AUDIOBOOKS_FILE.with_suffix(f'.backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
-            shutil.copy2(AUDIOBOOKS_FILE, backup_path)
-            logger.info(f"Created backup: {backup_path}")
+            rotate_backups()
         
         # Ensure directory exists
         AUDIOBOOKS_FILE.parent.mkdir(parents=True, exist_ok=True)
         
         # Save data
-        with open(AUDIOBOOKS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_file_atomic(AUDIOBOOKS_FILE, content)
+        _last_saved = (digest, get_audiobooks_file_key())
         logger.info(f"Saved audiobooks data to {AUDIOBOOKS_FILE}")
         return True
     except Exception as e:
         logger.error(f"Error saving audiobooks: {e}")
         return False
 
-def get_stats(data: dict) -> dict:
-    """Calculate collection statistics for configuration"""
-    authors = data.get("audiobooks", {}).get("author", {})
-    total_books = sum(len(books) for books in authors.values())
-    total_authors = len(authors)
+def file_timestamp() -> str:
+    """Local time as YYYYMMDD_HHMMSS for backup and export file names"""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+def rotate_backups() -> None:
+    """Back up audiobooks.json to a timestamped file at most once per BACKUP_INTERVAL_SECONDS,
+    keeping only the newest BACKUP_KEEP backups"""
+    global _last_backup_time
+    now = time.monotonic()
+    if _last_backup_time is not None and now - _last_backup_time < BACKUP_INTERVAL_SECONDS:
+        return
     
-    # Calculate publisher and narrator stats for reference
-    all_publishers = set()
-    all_narrators = set()
+    backup_path = AUDIOBOOKS_FILE.with_suffix(f'.backup_{file_timestamp()}.json')
+    # Saves always write a new file and os.replace() it over audiobooks.json, never rewriting
+    # it in place, so a hard link is a safe zero-copy backup; copy where links aren't supported
+    try:
+        os.link(AUDIOBOOKS_FILE, backup_path)
+    except OSError:
+        shutil.copy2(AUDIOBOOKS_FILE, backup_path)
+    _last_backup_time = now
+    logger.info(f"Created backup: {backup_path}")
     
-    for author_books in authors.values():
-        for book in author_books:
-            if book.get("publisher"):
-                all_publishers.add(book["publisher"])
-            if book.get("narrator"):
-                for narrator in book["narrator"]:
-                    if narrator.strip():
-                        all_narrators.add(narrator.strip())
+    # Timestamped names sort chronologically
+    backups = sorted(AUDIOBOOKS_FILE.parent.glob(f"{AUDIOBOOKS_FILE.stem}.backup_*.json"))
+    for old_backup in backups[:-BACKUP_KEEP]:
+        try:
+            old_backup.unlink()
+        except OSError as e:
+            logger.warning(f"Could not remove old backup {old_backup}: {e}")
+
+def encode_json_file(data: dict) -> bytes:
+    """Serialize data using the on-disk formatting of audiobooks.json"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+def write_file_atomic(path: Path, content: bytes) -> None:
+    """Atomically replace path with content.
     
+    The content is written to a temporary file in the same directory, flushed to disk and then
+    renamed over the target, so readers never see a partially written file.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def write_json_file(path: Path, data: dict) -> None:
+    """Atomically write data to a JSON file using the on-disk formatting of audiobooks.json"""
+    write_file_atomic(path, encode_json_file(data))
+
+# Async wrappers so request handlers don't block the event loop on disk I/O
+async def load_audiobooks_async() -> dict:
+    """Load audiobooks data in a worker thread"""
+    return await asyncio.to_thread(load_audiobooks)
+
+async def save_audiobooks_async(data: dict) -> bool:
+    """Save audiobooks data in a worker thread"""
+    return await asyncio.to_thread(save_audiobooks, data)
+
+def get_audiobooks_file_key() -> Optional[tuple]:
+    """(st_mtime_ns, st_size) of audiobooks.json, or None if it doesn't exist"""
+    try:
+        st = AUDIOBOOKS_FILE.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _audiobooks_stale() -> bool:
+    # Pending edits win over the file; they'll be written back by the flusher
+    return _AUDIOBOOKS_CACHE["data"] is None or (
+        not _dirty.is_set() and get_audiobooks_file_key() != _AUDIOBOOKS_CACHE["file_key"])
+
+async def get_audiobooks_data() -> dict:
+    """Get the shared in-memory audiobooks data, (re)loading it from disk when the file changed"""
+    if _audiobooks_stale():
+        # One reload at a time; requests queued behind it find the copy fresh again
+        async with _reload_lock:
+            if _audiobooks_stale():
+                cached = _AUDIOBOOKS_CACHE["data"]
+                file_key = get_audiobooks_file_key()
+                data = await load_audiobooks_async()
+                # Keep the in-memory copy if it was edited while the file was being read
+                if _AUDIOBOOKS_CACHE["data"] is cached and not _dirty.is_set():
+                    _AUDIOBOOKS_CACHE["data"] = data
+                    _AUDIOBOOKS_CACHE["file_key"] = file_key
+                    _AUDIOBOOKS_CACHE["index"] = None
+                    _invalidate_derived()
+    return _AUDIOBOOKS_CACHE["data"]
+
+async def get_authors_dict() -> dict:
+    """Get the live author -> books mapping; routes edit it in place and then call schedule_flush()"""
+    data = await get_audiobooks_data()
+    return data["audiobooks"]["author"]
+
+def schedule_flush(data: Optional[dict] = None) -> None:
+    """Mark the in-memory audiobooks data as changed (optionally replacing it) so it gets written to disk"""
+    if data is not None:
+        _AUDIOBOOKS_CACHE["data"] = data
+        _AUDIOBOOKS_CACHE["index"] = None
+    _invalidate_derived()
+    _FLUSH_STATE["last_edit"] = time.monotonic()
+    _dirty.set()
+
+def _invalidate_derived() -> None:
+    """Drop everything computed from the audiobooks data and bump its ETag version"""
+    _AUDIOBOOKS_CACHE["stats"] = None
+    _AUDIOBOOKS_CACHE["frontend"] = None
+    _AUDIOBOOKS_CACHE["author_pages"] = {}
+    _AUDIOBOOKS_CACHE["version"] += 1
+
+def snapshot_audiobooks(data: dict) -> dict:
+    """Copy data down to the per-author book lists so it can be serialized in a worker thread
+    while requests keep editing the live copy (book dicts are replaced, never edited in place)"""
+    audiobooks = data.get("audiobooks", {})
+    authors = audiobooks.get("author", {})
+    return {
+        **data,
+        "audiobooks": {**audiobooks, "author": {name: list(books) for name, books in authors.items()}}
+    }
+
+async def iter_collection_json(data: dict):
+    """Serialize audiobooks data as JSON one author at a time, so an export never holds
+    the whole document in memory; pass a snapshot_audiobooks() copy, not the live data"""
+    dumps = orjson.dumps
+    audiobooks = data.get("audiobooks", {})
+    yield b'{"audiobooks":{"author":{'
+    separator = b""
+    for name, books in audiobooks.get("author", {}).items():
+        yield separator + dumps(name) + b":" + dumps(books)
+        separator = b","
+    yield b"}"
+    for key, value in audiobooks.items():
+        if key != "author":
+            yield b"," + dumps(key) + b":" + dumps(value)
+    yield b"}"
+    for key, value in data.items():
+        if key != "audiobooks":
+            yield b"," + dumps(key) + b":" + dumps(value)
+    yield b"}"
+
+async def flush_audiobooks() -> bool:
+    """Write the in-memory audiobooks data to disk now"""
+    global _save_in_flight
+    # Saves share audiobooks.json.tmp, so never start one while another is still writing
+    if _save_in_flight is not None:
+        await asyncio.shield(_save_in_flight)
+    _dirty.clear()
+    data = _AUDIOBOOKS_CACHE["data"]
+    if data is None:
+        return True
+    _save_in_flight = asyncio.ensure_future(save_audiobooks_async(snapshot_audiobooks(data)))
+    if not await asyncio.shield(_save_in_flight):
+        _FLUSH_STATE["failed_at"] = datetime.now().isoformat(timespec="seconds")
+        return False
+    _FLUSH_STATE["failed_at"] = None
+    # Our own write shouldn't look like an outside change on the next read
+    _AUDIOBOOKS_CACHE["file_key"] = get_audiobooks_file_key()
+    return True
+
+async def _flush_loop() -> None:
+    """Coalesce bursts of edits into a single write of audiobooks.json"""
+    while True:
+        await _dirty.wait()
+        # Every edit restarts the quiet window, but a steady stream of edits is still written
+        # out FLUSH_MAX_DELAY_SECONDS after the first one
+        deadline = time.monotonic() + FLUSH_MAX_DELAY_SECONDS
+        while True:
+            delay = min(_FLUSH_STATE["last_edit"] + FLUSH_DELAY_SECONDS, deadline) - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        if not await flush_audiobooks():
+            logger.error(f"Failed to write audiobooks data, retrying in {FLUSH_RETRY_SECONDS}s")
+            _dirty.set()
+            await asyncio.sleep(FLUSH_RETRY_SECONDS)
+
+@dataclass(slots=True)
+class CollectionStats:
+    """Collection statistics; orjson serializes this directly (use asdict() for Jinja's tojson)"""
+    total_books: int
+    total_authors: int
+    total_publishers: int
+    total_narrators: int
+    publishers: List[str]
+    narrators: List[str]
+
+class StatsIndex:
+    """Book count plus publisher/narrator reference counts for the collection.
+
+    Routes update it as they add and remove books, so stats after an edit come from these
+    counters instead of a rescan of every book.
+    """
+    __slots__ = ("total_books", "publishers", "narrators")
+
+    def __init__(self):
+        self.total_books = 0
+        self.publishers: Counter = Counter()
+        self.narrators: Counter = Counter()
+
+    @classmethod
+    def from_data(cls, data: dict) -> "StatsIndex":
+        # Full rebuild: flatten once and let Counter's C-level counting loop consume
+        # generator pipelines instead of updating the counters book by book
+        books = [book for author_books in data.get("audiobooks", {}).get("author", {}).values()
+                 for book in author_books]
+        intern = sys.intern
+        strip = str.strip
+        index = cls()
+        index.total_books = len(books)
+        index.publishers = Counter(
+            intern(publisher) for publisher in [book.get("publisher") for book in books] if publisher)
+        index.narrators = Counter(
+            intern(narrator)
+            for book in books
+            for narrator in map(strip, book.get("narrator") or ())
+            if narrator)
+        return index
+
+    def add_books(self, books) -> None:
+        publishers = self.publishers
+        narrators = self.narrators
+        # The same few publishers/narrators repeat across most books; interned copies
+        # let the counters match them by identity instead of comparing characters
+        intern = sys.intern
+        for book in books:
+            self.total_books += 1
+            publisher = book.get("publisher")
+            if publisher:
+                publishers[intern(publisher)] += 1
+            for narrator in book.get("narrator") or ():
+                narrator = narrator.strip()
+                if narrator:
+                    narrators[intern(narrator)] += 1
+
+    def remove_books(self, books) -> None:
+        for book in books:
+            self.total_books -= 1
+            publisher = book.get("publisher")
+            if publisher:
+                self._release(self.publishers, publisher)
+            for narrator in book.get("narrator") or ():
+                narrator = narrator.strip()
+                if narrator:
+                    self._release(self.narrators, narrator)
+
+    @staticmethod
+    def _release(counter: Counter, name: str) -> None:
+        """Drop one reference to name, forgetting it once no book refers to it"""
+        if counter[name] <= 1:
+            counter.pop(name, None)
+        else:
+            counter[name] -= 1
+
+    def to_stats(self, total_authors: int) -> CollectionStats:
+        return CollectionStats(
+            total_books=self.total_books,
+            total_authors=total_authors,
+            total_publishers=len(self.publishers),
+            total_narrators=len(self.narrators),
+            publishers=sorted(self.publishers),
+            narrators=sorted(self.narrators)
+        )
+
+def get_stats(data: dict) -> CollectionStats:
+    """Calculate collection statistics for configuration"""
+    authors = data.get("audiobooks", {}).get("author", {})
+    return StatsIndex.from_data(data).to_stats(len(authors))
+
+async def get_stats_cached() -> CollectionStats:
+    """Statistics for the current audiobooks data, recomputed only after it changes"""
+    data = await get_audiobooks_data()
+    stats = _AUDIOBOOKS_CACHE["stats"]
+    if stats is None:
+        index = _AUDIOBOOKS_CACHE["index"]
+        if index is None:
+            index = _AUDIOBOOKS_CACHE["index"] = StatsIndex.from_data(data)
+        stats = _AUDIOBOOKS_CACHE["stats"] = index.to_stats(len(data["audiobooks"]["author"]))
+    return stats
+
+async def get_frontend_authors_cached() -> List[dict]:
+    """transform_audiobooks_for_frontend() of the current data, rebuilt only after it changes"""
+    data = await get_audiobooks_data()
+    authors_list = _AUDIOBOOKS_CACHE["frontend"]
+    if authors_list is None:
+        authors_list = _AUDIOBOOKS_CACHE["frontend"] = transform_audiobooks_for_frontend(data)
+    return authors_list
+
+def update_stats_index(added=(), removed=()) -> None:
+    """Apply a book edit to the stats index (if it has been built); call before schedule_flush()"""
+    index = _AUDIOBOOKS_CACHE["index"]
+    if index is not None:
+        index.remove_books(removed)
+        index.add_books(added)
+
+UPCOMING_SELECT = """
+    SELECT asin, title, author, narrator, publisher, series, series_number,
+           release_date, link, image_url, merchandising_summary, publisher_name,
+           last_checked, notified_channels
+    FROM audiobooks
+    WHERE release_date >= date('now')
+"""
+
+def upcoming_row_to_dict(asin, title, author, narrator, publisher, series, series_number, release_date,
+                         link, image_url, merchandising_summary, publisher_name, last_checked,
+                         notified_channels) -> dict:
+    """Build the API dict for one UPCOMING_SELECT row (pass the row positionally: upcoming_row_to_dict(*row))"""
     return {
-        "total_books": total_books,
-        "total_authors": total_authors,
-        "total_publishers": len(all_publishers),
-        "total_narrators": len(all_narrators),
-        "publishers": sorted(list(all_publishers)),
-        "narrators": sorted(list(all_narrators))
+        "asin": asin,
+        "title": title,
+        "author": author,
+        "narrator": narrator,
+        "publisher": publisher,
+        "series": series,
+        "series_number": series_number,
+        "release_date": release_date,
+        "link": link,
+        "image_url": image_url,
+        "merchandising_summary": merchandising_summary,
+        "publisher_name": publisher_name,
+        "last_checked": last_checked,
+        "notified_channels": orjson.loads(notified_channels) if notified_channels else {}
     }
 
 def get_upcoming_audiobooks() -> List[dict]:
     """Get upcoming audiobooks from the database"""
     try:
-        # Initialize database if it doesn't exist
-        init_db()
-        
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT asin, title, author, narrator, publisher, series, series_number, 
-                       release_date, link, image_url, merchandising_summary, publisher_name,
-                       last_checked, notified_channels
-                FROM audiobooks 
-                WHERE release_date >= date('now')
-                ORDER BY release_date ASC, author ASC, series ASC, series_number ASC
-            """)
-            
-            audiobooks = []
-            for row in cursor.fetchall():
-                audiobook = {
-                    "asin": row["asin"],
-                    "title": row["title"],
-                    "author": row["author"],
-                    "narrator": row["narrator"],
-                    "publisher": row["publisher"],
-                    "series": row["series"],
-                    "series_number": row["series_number"],
-                    "release_date": row["release_date"],
-                    "link": row["link"],
-                    "image_url": row["image_url"],
-                    "merchandising_summary": row["merchandising_summary"],
-                    "publisher_name": row["publisher_name"],
-                    "last_checked": row["last_checked"],
-                    "notified_channels": json.loads(row["notified_channels"]) if row["notified_channels"] else {}
-                }
-                audiobooks.append(audiobook)
-            
-            return audiobooks
+        # Rows are plain tuples, unpacked positionally
+        cursor = get_read_connection().execute(UPCOMING_SELECT + """
+            ORDER BY release_date ASC, author ASC, series ASC, series_number ASC
+        """)
+        return [upcoming_row_to_dict(*row) for row in cursor]
     except Exception as e:
         logger.error(f"Error getting upcoming audiobooks: {e}")
         return []
 
+# Same rows and order as get_upcoming_audiobooks(), but each row is rendered to a JSON object by
+# SQLite itself so /api/upcoming never materializes a Python dict per row
+UPCOMING_JSON_SELECT = """
+    SELECT json_object(
+        'asin', asin, 'title', title, 'author', author, 'narrator', narrator,
+        'publisher', publisher, 'series', series, 'series_number', series_number,
+        'release_date', release_date, 'link', link, 'image_url', image_url,
+        'merchandising_summary', merchandising_summary, 'publisher_name', publisher_name,
+        'last_checked', last_checked,
+        'notified_channels', json(CASE WHEN notified_channels IS NULL OR notified_channels = ''
+                                       THEN '{}' ELSE notified_channels END)
+    )
+    FROM audiobooks
+    WHERE release_date >= date('now')
+    ORDER BY release_date ASC, author ASC, series ASC, series_number ASC
+"""
+
+def get_upcoming_audiobooks_json() -> bytes:
+    """Get upcoming audiobooks from the database as a ready-to-send JSON array"""
+    try:
+        cursor = get_read_connection().execute(UPCOMING_JSON_SELECT)
+        return ("[" + ",".join([row[0] for row in cursor]) + "]").encode("utf-8")
+    except Exception as e:
+        logger.error(f"Error getting upcoming audiobooks: {e}")
+        return b"[]"
+
+def _db_change_key() -> Optional[tuple]:
+    """Today's date, SQLite's data_version and (st_mtime_ns, st_size) of the database file and its WAL.
+    data_version moves on every commit made through another connection, whichever process makes it,
+    even when a same-size write lands within the filesystem's mtime granularity; None when the
+    database isn't a plain file or can't be read, so nothing should be cached."""
+    try:
+        db_stat = os.stat(database.DB_FILE)
+        # The read connection belongs to the calling thread, so successive keys compare one counter
+        data_version = get_read_connection().execute("PRAGMA data_version").fetchone()[0]
+    except (OSError, sqlite3.Error):
+        return None
+    try:
+        wal_stat = os.stat(database.DB_FILE + "-wal")
+    except OSError:
+        wal_stat = None
+    # An empty WAL holds no changes; opening the first connection creates one
+    wal_key = (wal_stat.st_mtime_ns, wal_stat.st_size) if wal_stat and wal_stat.st_size else (0, 0)
+    return (date.today().isoformat(), data_version, db_stat.st_mtime_ns, db_stat.st_size, *wal_key)
+
+async def get_upcoming_json_cached() -> bytes:
+    """get_upcoming_audiobooks_json(), rebuilt (in a worker thread) only when the database changes"""
+    # Taken before the rebuild so a write that lands during it invalidates the result
+    key = _db_change_key()
+    if key is None or _UPCOMING_CACHE["key"] != key:
+        upcoming_json = await asyncio.to_thread(get_upcoming_audiobooks_json)
+        _UPCOMING_CACHE["key"], _UPCOMING_CACHE["json"] = key, upcoming_json
+    return _UPCOMING_CACHE["json"]
+
+async def _etag_for_audiobooks() -> str:
+    """Weak ETag for the audiobooks data; changes with every in-memory edit or external reload"""
+    await get_audiobooks_data()
+    return f'W/"{_ETAG_BOOT_ID}-{_AUDIOBOOKS_CACHE["version"]}"'
+
+def _etag_for_db() -> str:
+    """Weak ETag for the audiobooks table, derived from _db_change_key() so any committed write
+    changes it; the date is included because 'upcoming' depends on it"""
+    key = _db_change_key()
+    if key is None:
+        # No file to watch: an ETag that never matches, so every request gets fresh data
+        return f'W/"{uuid.uuid4().hex}"'
+    return 'W/"' + "-".join(map(str, key)) + '"'
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the request's If-None-Match already has this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or
+                          etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+def htmlsafe_json(raw: bytes) -> Markup:
+    """Mark pre-serialized JSON safe for embedding in a template, escaped like Jinja's tojson filter"""
+    return Markup(
+        raw.decode("utf-8")
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+        .replace("'", "\\u0027")
+    )
+
+def get_upcoming_audiobook(asin: str) -> Optional[dict]:
+    """Get a single upcoming audiobook by ASIN (primary key lookup), or None"""
+    row = get_read_connection().execute(UPCOMING_SELECT + " AND asin = ?", (asin,)).fetchone()
+    return upcoming_row_to_dict(*row) if row else None
+
+# Read-only statements are module constants so every call sends identical SQL text and hits the
+# read connection's prepared-statement cache instead of being re-parsed
+
+# Upcoming book/author/publisher totals in one pass over the upcoming rows, plus
+# recent additions (books added to DB in last 7 days)
+DATABASE_TOTALS_SQL = """
+    SELECT COUNT(*), COUNT(DISTINCT author), COUNT(DISTINCT publisher),
+           (SELECT COUNT(*) FROM audiobooks
+            WHERE last_checked >= datetime('now', '-7 days'))
+    FROM audiobooks
+    WHERE release_date >= date('now')
+"""
+
+# Upcoming books by month
+DATABASE_MONTHLY_SQL = """
+    SELECT strftime('%Y-%m', release_date) as month, COUNT(*) as count
+    FROM audiobooks 
+    WHERE release_date >= date('now')
+    GROUP BY strftime('%Y-%m', release_date)
+    ORDER BY month
+    LIMIT 12
+"""
+
+# Upcoming releases per month up to date('now', ?)
+RELEASE_COUNTS_BY_MONTH_SQL = """
+    SELECT 
+        strftime('%Y-%m', release_date) as month,
+        COUNT(*) as count
+    FROM audiobooks 
+    WHERE release_date IS NOT NULL 
+        AND release_date >= date('now')
+        AND release_date <= date('now', ?)
+    GROUP BY month
+    ORDER BY month
+"""
+
+TOP_AUTHORS_SQL = """
+    SELECT 
+        author,
+        COUNT(*) as count
+    FROM audiobooks 
+    WHERE release_date IS NOT NULL 
+        AND release_date >= date('now')
+    GROUP BY author
+    ORDER BY count DESC
+    LIMIT 6
+"""
+
 def get_database_stats() -> dict:
     """Get statistics from the database"""
     try:
-        init_db()
+        conn = get_read_connection()
+        upcoming_books, total_authors, total_publishers, recent_additions = conn.execute(
+            DATABASE_TOTALS_SQL).fetchone()
+        monthly_releases = [{"month": month, "count": count}
+                            for month, count in conn.execute(DATABASE_MONTHLY_SQL)]
         
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Total upcoming books
-            cursor.execute("SELECT COUNT(*) FROM audiobooks WHERE release_date >= date('now')")
-            upcoming_books = cursor.fetchone()[0]
-            
-            # Total authors
-            cursor.execute("SELECT COUNT(DISTINCT author) FROM audiobooks WHERE release_date >= date('now')")
-            total_authors = cursor.fetchone()[0]
-            
-            # Total publishers
-            cursor.execute("SELECT COUNT(DISTINCT publisher) FROM audiobooks WHERE release_date >= date('now')")
-            total_publishers = cursor.fetchone()[0]
-            
-            # Books by month
-            cursor.execute("""
-                SELECT strftime('%Y-%m', release_date) as month, COUNT(*) as count
-                FROM audiobooks 
-                WHERE release_date >= date('now')
-                GROUP BY strftime('%Y-%m', release_date)
-                ORDER BY month
-                LIMIT 12
-            """)
-            monthly_releases = [{"month": row[0], "count": row[1]} for row in cursor.fetchall()]
-            
-            # Recent additions (books added to DB in last 7 days)
-            cursor.execute("""
-                SELECT COUNT(*) FROM audiobooks 
-                WHERE last_checked >= datetime('now', '-7 days')
-            """)
-            recent_additions = cursor.fetchone()[0]
-            
-            return {
-                "upcoming_books": upcoming_books,
-                "total_authors": total_authors,
-                "total_publishers": total_publishers,
-                "monthly_releases": monthly_releases,
-                "recent_additions": recent_additions
-            }
+        return {
+            "upcoming_books": upcoming_books,
+            "total_authors": total_authors,
+            "total_publishers": total_publishers,
+            "monthly_releases": monthly_releases,
+            "recent_additions": recent_additions
+        }
     except Exception as e:
         logger.error(f"Error getting database stats: {e}")
         return {
@@ -376,11 +885,13 @@ def get_database_stats() -> dict:
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Main page with upcoming audiobooks from database"""
-    upcoming_audiobooks = get_upcoming_audiobooks()
-    stats = get_database_stats()
+    # The page embeds the list as JSON, so reuse the SQLite-rendered array from /api/upcoming
+    # rather than building row dicts only for tojson to serialize them again
+    upcoming_audiobooks_json = htmlsafe_json(await get_upcoming_json_cached())
+    stats = await asyncio.to_thread(get_database_stats)
     return templates.TemplateResponse("upcoming.html", {
         "request": request,
-        "upcoming_audiobooks": upcoming_audiobooks,
+        "upcoming_audiobooks_json": upcoming_audiobooks_json,
         "stats": stats
     })
 
@@ -395,161 +906,147 @@ async def analytics(request: Request):
 @app.get("/config", response_class=HTMLResponse)
 async def config_redirect():
     """Redirect old config route to new authors route"""
-    from fastapi.responses import RedirectResponse
     return RedirectResponse(url="/authors", status_code=301)
 
 # Legacy redirect for backward compatibility
 @app.get("/config/author/{author_name}", response_class=HTMLResponse)
 async def config_author_redirect(author_name: str):
     """Redirect old config author route to new authors author route"""
-    from fastapi.responses import RedirectResponse
     return RedirectResponse(url=f"/authors/author/{author_name}", status_code=301)
 
 @app.get("/authors", response_class=HTMLResponse)
 async def authors_page(request: Request):
     """Authors management page for managing JSON watchlist"""
-    data = load_audiobooks()
-    authors_list = transform_audiobooks_for_frontend(data)
-    stats = get_stats(data)
+    authors_list = await get_frontend_authors_cached()
+    stats = await get_stats_cached()
     return templates.TemplateResponse("authors.html", {
         "request": request,
         "audiobooks": authors_list,
-        "stats": stats
+        "stats": asdict(stats)
     })
 
 @app.get("/api/upcoming")
-async def get_upcoming():
+async def get_upcoming(request: Request):
     """Get upcoming audiobooks from database"""
-    return get_upcoming_audiobooks()
+    etag = _etag_for_db()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    return Response(content=await get_upcoming_json_cached(), media_type="application/json",
+                    headers={"ETag": etag})
 
 @app.get("/api/database/stats")
-async def get_database_stats_api():
+async def get_database_stats_api(request: Request):
     """Get database statistics"""
-    return get_database_stats()
+    etag = _etag_for_db()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    return ORJSONResponse(await asyncio.to_thread(get_database_stats), headers={"ETag": etag})
 
 # Analytics API endpoints
+def query_release_counts_by_month(horizon: str) -> dict:
+    """Upcoming releases per month from now until date('now', horizon)"""
+    results = get_read_connection().execute(RELEASE_COUNTS_BY_MONTH_SQL, (horizon,)).fetchall()
+    
+    return {"labels": [result[0] for result in results], "values": [result[1] for result in results]}
+
+def query_top_authors() -> dict:
+    """Top authors by number of upcoming releases"""
+    results = get_read_connection().execute(TOP_AUTHORS_SQL).fetchall()
+    
+    return {"labels": [result[0] for result in results], "values": [result[1] for result in results]}
+
+def get_analytics_cached(key: str, query, *args) -> dict:
+    """Return query(*args), reusing the last result while the database is unchanged.
+    Failed queries raise and are not cached."""
+    change_key = _db_change_key()
+    entry = _ANALYTICS_CACHE.get(key)
+    if change_key is not None and entry is not None and entry[0] == change_key:
+        return entry[1]
+    result = query(*args)
+    _ANALYTICS_CACHE[key] = (change_key, result)
+    return result
+
 @app.get("/api/analytics/release-trends")
 async def get_release_trends():
     """Get release trends data for analytics dashboard"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Get releases grouped by month for the next 12 months
-        cursor.execute("""
-            SELECT 
-                strftime('%Y-%m', release_date) as month,
-                COUNT(*) as count
-            FROM audiobooks 
-            WHERE release_date IS NOT NULL 
-                AND release_date >= date('now')
-                AND release_date <= date('now', '+12 months')
-            GROUP BY month
-            ORDER BY month
-        """)
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        labels = [result[0] for result in results]
-        values = [result[1] for result in results]
-        
-        return {"labels": labels, "values": values}
+        # Releases grouped by month for the next 12 months
+        return ORJSONResponse(get_analytics_cached("release-trends", query_release_counts_by_month, '+12 months'))
     except Exception as e:
         logger.error(f"Error getting release trends: {e}")
-        return {"labels": [], "values": []}
+        return ORJSONResponse({"labels": [], "values": []})
 
 @app.get("/api/analytics/top-authors")
 async def get_top_authors():
     """Get top authors by number of upcoming releases"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                author,
-                COUNT(*) as count
-            FROM audiobooks 
-            WHERE release_date IS NOT NULL 
-                AND release_date >= date('now')
-            GROUP BY author
-            ORDER BY count DESC
-            LIMIT 6
-        """)
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        labels = [result[0] for result in results]
-        values = [result[1] for result in results]
-        
-        return {"labels": labels, "values": values}
+        return ORJSONResponse(get_analytics_cached("top-authors", query_top_authors))
     except Exception as e:
         logger.error(f"Error getting top authors: {e}")
-        return {"labels": [], "values": []}
+        return ORJSONResponse({"labels": [], "values": []})
 
 @app.get("/api/analytics/upcoming-count")
 async def get_upcoming_count():
     """Get upcoming releases count by month"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                strftime('%Y-%m', release_date) as month,
-                COUNT(*) as count
-            FROM audiobooks 
-            WHERE release_date IS NOT NULL 
-                AND release_date >= date('now')
-                AND release_date <= date('now', '+6 months')
-            GROUP BY month
-            ORDER BY month
-        """)
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        labels = [result[0] for result in results]
-        values = [result[1] for result in results]
-        
-        return {"labels": labels, "values": values}
+        return ORJSONResponse(get_analytics_cached("upcoming-count", query_release_counts_by_month, '+6 months'))
     except Exception as e:
         logger.error(f"Error getting upcoming count: {e}")
-        return {"labels": [], "values": []}
+        return ORJSONResponse({"labels": [], "values": []})
+
+@app.get("/api/dashboard")
+async def get_dashboard(request: Request):
+    """All analytics charts in one response (one round trip for the dashboard)"""
+    # Taken before the charts are read, so they are never older than the ETag they are sent with
+    etag = _etag_for_db()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    empty_chart = {"labels": [], "values": []}
+    charts = {}
+    for name, key, query, args in (
+        ("trends", "release-trends", query_release_counts_by_month, ('+12 months',)),
+        ("top_authors", "top-authors", query_top_authors, ()),
+        ("upcoming_count", "upcoming-count", query_release_counts_by_month, ('+6 months',)),
+    ):
+        try:
+            charts[name] = get_analytics_cached(key, query, *args)
+        except Exception as e:
+            logger.error(f"Error getting {key} for dashboard: {e}")
+            charts[name] = empty_chart
+    return ORJSONResponse(charts, headers={"ETag": etag})
 
 @app.get("/api/audiobooks")
-async def get_audiobooks():
+async def get_audiobooks(request: Request):
     """Get all audiobooks data"""
-    data = load_audiobooks()
-    authors_list = transform_audiobooks_for_frontend(data)
-    stats = get_stats(data)
-    return {"data": authors_list, "stats": stats}
+    etag = await _etag_for_audiobooks()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    authors_list = await get_frontend_authors_cached()
+    stats = await get_stats_cached()
+    return ORJSONResponse({"data": authors_list, "stats": stats}, headers={"ETag": etag})
 
 @app.get("/api/config")
-async def get_config():
+async def get_config(request: Request):
     """Get authors configuration data (alias for audiobooks)"""
-    data = load_audiobooks()
-    authors_list = transform_audiobooks_for_frontend(data)
-    return authors_list
+    etag = await _etag_for_audiobooks()
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    authors_list = await get_frontend_authors_cached()
+    return ORJSONResponse(authors_list, headers={"ETag": etag})
 
 @app.post("/api/audiobooks")
-async def save_audiobooks_api(request: Request):
+async def save_audiobooks_api(collection: AudiobookCollection):
     """Save audiobooks data"""
     try:
-        audiobooks = await request.json()
-        
-        # Validate the structure
-        if "audiobooks" not in audiobooks or "author" not in audiobooks["audiobooks"]:
-            logger.error(f"Invalid structure - expected audiobooks.author, got keys: {list(audiobooks.keys())}")
-            raise HTTPException(status_code=400, detail="Invalid audiobook data structure")
-        
-        if save_audiobooks(audiobooks):
-            stats = get_stats(audiobooks)
-            return {"success": True, "message": "Audiobooks saved successfully", "stats": stats}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save audiobooks")
+        audiobooks = collection.model_dump(exclude_unset=True)
+        schedule_flush(audiobooks)
+        stats = get_stats(audiobooks)
+        return ORJSONResponse({"success": True, "message": "Audiobooks saved successfully", "stats": stats})
     except Exception as e:
         logger.error(f"Error in save_audiobooks_api: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -558,18 +1055,15 @@ async def save_audiobooks_api(request: Request):
 async def add_author(author_name: str = Form(...)):
     """Add a new author"""
     try:
-        data = load_audiobooks()
-        authors = data["audiobooks"]["author"]
+        authors = await get_authors_dict()
         
         if author_name in authors:
             raise HTTPException(status_code=400, detail="Author already exists")
         
         authors[author_name] = []
         
-        if save_audiobooks(data):
-            return {"success": True, "message": f"Author '{author_name}' added successfully"}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save changes")
+        schedule_flush()
+        return ORJSONResponse({"success": True, "message": f"Author '{author_name}' added successfully"})
     except HTTPException:
         raise
     except Exception as e:
@@ -580,60 +1074,53 @@ async def add_author(author_name: str = Form(...)):
 async def delete_author(author_name: str):
     """Delete an author and all their books"""
     try:
-        logger.debug(f"=== DELETE_AUTHOR API START ===")
-        logger.debug(f"Request to delete author: {author_name}")
+        logger.debug("=== DELETE_AUTHOR API START ===")
+        logger.debug("Request to delete author: %s", author_name)
         
-        data = load_audiobooks()
-        logger.debug(f"Loaded current audiobooks data")
-        
-        authors = data["audiobooks"]["author"]
+        authors = await get_authors_dict()
+        logger.debug("Loaded current audiobooks data")
         
         if author_name not in authors:
             logger.warning(f"Author not found: {author_name}")
-            logger.debug(f"Available authors: {list(authors.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available authors: %s", list(authors))
             raise HTTPException(status_code=404, detail="Author not found")
         
         # Get book count for logging
         book_count = len(authors[author_name])
-        logger.debug(f"Author '{author_name}' has {book_count} books")
+        logger.debug("Author '%s' has %d books", author_name, book_count)
         
+        update_stats_index(removed=authors[author_name])
         del authors[author_name]
-        logger.debug(f"Removed author '{author_name}' from data structure")
+        logger.debug("Removed author '%s' from data structure", author_name)
         
-        logger.debug(f"Calling save_audiobooks...")
-        if save_audiobooks(data):
-            logger.info(f"Successfully deleted author '{author_name}' with {book_count} books")
-            logger.debug(f"=== DELETE_AUTHOR API SUCCESS ===")
-            return {"success": True, "message": f"Author '{author_name}' deleted successfully"}
-        else:
-            logger.error(f"save_audiobooks function returned False for author deletion")
-            logger.debug(f"=== DELETE_AUTHOR API FAILED ===")
-            raise HTTPException(status_code=500, detail="Failed to save changes")
+        schedule_flush()
+        logger.info(f"Successfully deleted author '{author_name}' with {book_count} books")
+        logger.debug("=== DELETE_AUTHOR API SUCCESS ===")
+        return ORJSONResponse({"success": True, "message": f"Author '{author_name}' deleted successfully"})
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error deleting author: {e}")
         logger.error(f"Exception type: {type(e)}")
-        logger.debug(f"=== DELETE_AUTHOR API EXCEPTION ===")
+        logger.debug("=== DELETE_AUTHOR API EXCEPTION ===")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/authors/{author_name}/books")
 async def add_book(author_name: str, book: Audiobook):
     """Add a book to an author"""
     try:
-        data = load_audiobooks()
-        authors = data["audiobooks"]["author"]
+        authors = await get_authors_dict()
         
         if author_name not in authors:
             authors[author_name] = []
         
-        book_dict = book.dict()
+        book_dict = book.model_dump()
         authors[author_name].append(book_dict)
+        update_stats_index(added=[book_dict])
         
-        if save_audiobooks(data):
-            return {"success": True, "message": f"Book added to {author_name}", "book": book_dict}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save changes")
+        schedule_flush()
+        return ORJSONResponse({"success": True, "message": f"Book added to {author_name}", "book": book_dict})
     except HTTPException:
         raise
     except Exception as e:
@@ -644,8 +1131,7 @@ async def add_book(author_name: str, book: Audiobook):
 async def update_book(author_name: str, book_index: int, book: Audiobook):
     """Update a specific book"""
     try:
-        data = load_audiobooks()
-        authors = data["audiobooks"]["author"]
+        authors = await get_authors_dict()
         
         if author_name not in authors:
             raise HTTPException(status_code=404, detail="Author not found")
@@ -653,13 +1139,12 @@ async def update_book(author_name: str, book_index: int, book: Audiobook):
         if book_index >= len(authors[author_name]):
             raise HTTPException(status_code=404, detail="Book not found")
         
-        book_dict = book.dict()
+        book_dict = book.model_dump()
+        update_stats_index(added=[book_dict], removed=[authors[author_name][book_index]])
         authors[author_name][book_index] = book_dict
         
-        if save_audiobooks(data):
-            return {"success": True, "message": "Book updated successfully", "book": book_dict}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save changes")
+        schedule_flush()
+        return ORJSONResponse({"success": True, "message": "Book updated successfully", "book": book_dict})
     except HTTPException:
         raise
     except Exception as e:
@@ -670,8 +1155,7 @@ async def update_book(author_name: str, book_index: int, book: Audiobook):
 async def delete_book(author_name: str, book_index: int):
     """Delete a specific book"""
     try:
-        data = load_audiobooks()
-        authors = data["audiobooks"]["author"]
+        authors = await get_authors_dict()
         
         if author_name not in authors:
             raise HTTPException(status_code=404, detail="Author not found")
@@ -680,34 +1164,82 @@ async def delete_book(author_name: str, book_index: int):
             raise HTTPException(status_code=404, detail="Book not found")
         
         deleted_book = authors[author_name].pop(book_index)
+        update_stats_index(removed=[deleted_book])
         
-        if save_audiobooks(data):
-            return {"success": True, "message": "Book deleted successfully", "deleted_book": deleted_book}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save changes")
+        schedule_flush()
+        return ORJSONResponse({"success": True, "message": "Book deleted successfully", "deleted_book": deleted_book})
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error deleting book: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def apply_batch_operation(authors: dict, operation: BatchOperation) -> None:
+    """Apply one batch edit to an author -> books mapping, raising ValueError if it can't be applied"""
+    op = operation.op
+    author = operation.author
+    if op == "add_author":
+        if author in authors:
+            raise ValueError(f"Author '{author}' already exists")
+        authors[author] = []
+        return
+    if op == "add_book":
+        if operation.book is None:
+            raise ValueError("add_book requires a book")
+        authors.setdefault(author, []).append(operation.book.model_dump())
+        return
+    if author not in authors:
+        raise ValueError(f"Author '{author}' not found")
+    if op == "delete_author":
+        del authors[author]
+        return
+    books = authors[author]
+    if operation.index is None or not 0 <= operation.index < len(books):
+        raise ValueError(f"Book {operation.index} not found for '{author}'")
+    if op == "update_book":
+        if operation.book is None:
+            raise ValueError("update_book requires a book")
+        books[operation.index] = operation.book.model_dump()
+    else:  # delete_book
+        del books[operation.index]
+
+@app.post("/api/audiobooks/batch")
+async def batch_update(operations: List[BatchOperation]):
+    """Apply a list of author/book edits all-or-nothing and save them with a single write"""
+    data = await get_audiobooks_data()
+    # Work on a copy so a failing operation leaves the collection untouched
+    working = snapshot_audiobooks(data)
+    authors = working["audiobooks"]["author"]
+    for position, operation in enumerate(operations):
+        try:
+            apply_batch_operation(authors, operation)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Operation {position} ({operation.op}): {e}")
+    
+    schedule_flush(working)
+    return ORJSONResponse({
+        "success": True,
+        "message": f"Applied {len(operations)} operations",
+        "stats": await get_stats_cached()
+    })
+
 @app.get("/api/stats")
 async def get_collection_stats():
-    """Get collection statistics"""
-    data = load_audiobooks()
-    stats = get_stats(data)
-    return stats
+    """Get collection statistics, plus whether edits are still waiting to be written to disk"""
+    return ORJSONResponse({
+        **asdict(await get_stats_cached()),
+        "unsaved_changes": _dirty.is_set(),
+        "last_write_failed_at": _FLUSH_STATE["failed_at"],
+    })
 
 @app.post("/api/export")
 async def export_collection():
     """Export the current collection as JSON file"""
     try:
-        data = load_audiobooks()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"audiobooks_export_{timestamp}.json"
-        json_bytes = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        data = await get_audiobooks_data()
+        filename = f"audiobooks_export_{file_timestamp()}.json"
         return StreamingResponse(
-            iter([json_bytes]),
+            iter_collection_json(snapshot_audiobooks(data)),
             media_type="application/json",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -718,88 +1250,87 @@ async def export_collection():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/import")
-async def import_collection(import_data: dict):
+async def import_collection(collection: AudiobookCollection):
     """Import audiobook collection data"""
     try:
-        # Validate structure
-        if "audiobooks" not in import_data or "author" not in import_data["audiobooks"]:
-            raise HTTPException(status_code=400, detail="Invalid import data structure")
+        # Already validated by FastAPI; only keep the fields that were actually supplied
+        import_data = collection.model_dump(exclude_unset=True)
         
         # Create backup before import
-        current_data = load_audiobooks()
-        backup_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = AUDIOBOOKS_FILE.with_suffix(f'.pre_import_backup_{backup_timestamp}.json')
+        current_data = await get_audiobooks_data()
+        backup_path = AUDIOBOOKS_FILE.with_suffix(f'.pre_import_backup_{file_timestamp()}.json')
         
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(current_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(write_json_file, backup_path, snapshot_audiobooks(current_data))
         
         # Save imported data
-        if save_audiobooks(import_data):
-            stats = get_stats(import_data)
-            return {
-                "success": True,
-                "message": "Collection imported successfully",
-                "stats": stats,
-                "backup_created": str(backup_path)
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save imported data")
+        schedule_flush(import_data)
+        stats = get_stats(import_data)
+        return ORJSONResponse({
+            "success": True,
+            "message": "Collection imported successfully",
+            "stats": stats,
+            "backup_created": str(backup_path)
+        })
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error importing collection: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+MANUAL_SEARCH_TIMEOUT_SECONDS = 600  # 10 minute timeout
+_background_tasks = set()
+
+async def run_manual_search(main_script: Path) -> None:
+    """Run main.py as a child process and log the outcome, without tying up a worker thread"""
+    try:
+        # Get the project root directory
+        project_root = Path(__file__).parent.parent.parent  # /home/quentin/dev/audiobook_feed
+        logger.info(f"Running manual search from directory: {project_root}")
+        
+        # Run the main.py script directly (it now handles imports properly)
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(main_script),
+            cwd=str(project_root),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=MANUAL_SEARCH_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.error("Manual search timed out after 10 minutes")
+            return
+        
+        if process.returncode == 0:
+            logger.info("Manual search completed successfully")
+            logger.info(f"Output: {stdout.decode(errors='replace')}")
+        else:
+            logger.error(f"Manual search failed with return code {process.returncode}")
+            logger.error(f"Error: {stderr.decode(errors='replace')}")
+    
+    except Exception as e:
+        logger.error(f"Error running manual search: {e}")
+
 @app.post("/api/manual-start")
 async def manual_start():
     """Manually trigger the audiobook search process"""
     try:
-        import subprocess
-        import threading
-        from pathlib import Path
-        
         # Path to the main.py script
         main_script = Path(__file__).parent.parent / "main.py"
         
         if not main_script.exists():
             raise HTTPException(status_code=500, detail="Main script not found")
         
-        # Function to run the script in background
-        def run_script():
-            try:
-                # Get the project root directory
-                project_root = Path(__file__).parent.parent.parent  # /home/quentin/dev/audiobook_feed
-                logger.info(f"Running manual search from directory: {project_root}")
-                
-                # Run the main.py script directly (it now handles imports properly)
-                result = subprocess.run(
-                    [sys.executable, str(main_script)],
-                    cwd=str(project_root),
-                    capture_output=True,
-                    text=True,
-                    timeout=600  # 10 minute timeout
-                )
-                
-                if result.returncode == 0:
-                    logger.info("Manual search completed successfully")
-                    logger.info(f"Output: {result.stdout}")
-                else:
-                    logger.error(f"Manual search failed with return code {result.returncode}")
-                    logger.error(f"Error: {result.stderr}")
-                
-            except subprocess.TimeoutExpired:
-                logger.error("Manual search timed out after 10 minutes")
-            except Exception as e:
-                logger.error(f"Error running manual search: {e}")
-        
-        # Start the script in a background thread
-        thread = threading.Thread(target=run_script, daemon=True)
-        thread.start()
+        # Run the search in the background; keep a reference so the task isn't garbage collected
+        task = asyncio.create_task(run_manual_search(main_script))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Manual audiobook search started successfully. Check the logs for progress."
-        }
+        })
         
     except Exception as e:
         logger.error(f"Error starting manual search: {e}")
@@ -812,12 +1343,12 @@ async def manual_start_test():
         from pathlib import Path
         main_script = Path(__file__).parent.parent / "main.py"
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Manual start API is working",
             "main_script_exists": main_script.exists(),
             "main_script_path": str(main_script)
-        }
+        })
     except Exception as e:
         logger.error(f"Error in manual start test: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -827,11 +1358,10 @@ async def author_detail_page(request: Request, author_name: str):
     """Author detail page for managing individual author's books"""
     try:
         # URL decode the author name
-        from urllib.parse import unquote
         author_name = unquote(author_name)
         
         # Load all audiobooks data
-        data = load_audiobooks()
+        data = await get_audiobooks_data()
         
         # Get books for this specific author (fix data structure)
         authors_data = data.get("audiobooks", {}).get("author", {})
@@ -845,54 +1375,25 @@ async def author_detail_page(request: Request, author_name: str):
         # Get the author's books (might be an empty list for newly added authors)
         author_books = authors_data.get(author_name, [])
         
-        # Set a flag to indicate if this is a newly created author with no books
-        is_new_author = len(author_books) == 0
-        
-        # Calculate author-specific stats
-        total_books = len(author_books)
-        complete_books = sum(1 for book in author_books if is_book_complete(book))
-        completion_percentage = round((complete_books / total_books) * 100) if total_books > 0 else 0
-        
-        # Get unique publishers and narrators
-        publishers = list(set(book.get('publisher', '') for book in author_books if book.get('publisher')))
-        narrators = []
-        for book in author_books:
-            if book.get('narrator'):
-                if isinstance(book['narrator'], list):
-                    narrators.extend(book['narrator'])
-                else:
-                    narrators.append(book['narrator'])
-        unique_narrators = list(set(filter(None, narrators)))
-        
-        # Get series information
-        series_data = {}
-        for book in author_books:
-            series_name = book.get('series', '')
-            if series_name:
-                if series_name not in series_data:
-                    series_data[series_name] = []
-                series_data[series_name].append(book)
-        
-        author_stats = {
-            'total_books': total_books,
-            'complete_books': complete_books,
-            'incomplete_books': total_books - complete_books,
-            'completion_percentage': completion_percentage,
-            'total_series': len(series_data),
-            'total_publishers': len(publishers),
-            'total_narrators': len(unique_narrators)
-        }
-        
-        return templates.TemplateResponse("author_detail.html", {
+        # The page doesn't depend on the request, so the rendered HTML is kept until the data or
+        # the template changes (get_template() returns a new object when Jinja reloads the file).
+        # With reload on, pages are always rendered fresh so template edits show up immediately.
+        template = templates.get_template("author_detail.html")
+        author_pages = _AUDIOBOOKS_CACHE["author_pages"]
+        cached = author_pages.get(author_name)
+        if cached is not None and cached[0] is template:
+            return HTMLResponse(cached[1])
+        html = template.render({
             "request": request,
             "author_name": author_name,
             "author_books": author_books,
-            "series_data": series_data,
-            "publishers": publishers,
-            "narrators": unique_narrators,
-            "stats": author_stats,
-            "is_new_author": is_new_author
+            **compute_author_details(author_books),
+            # Set a flag to indicate if this is a newly created author with no books
+            "is_new_author": len(author_books) == 0
         })
+        if not WEB_RELOAD:
+            author_pages[author_name] = (template, html)
+        return HTMLResponse(html)
         
     except HTTPException:
         raise
@@ -900,15 +1401,57 @@ async def author_detail_page(request: Request, author_name: str):
         logger.error(f"Error loading author detail for '{author_name}': {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error loading author detail: {str(e)}")
 
+def compute_author_details(author_books: list) -> dict:
+    """Series grouping, unique publishers/narrators and completion stats for one author's books,
+    gathered in a single pass over the books"""
+    series_data = defaultdict(list)
+    publishers = set()
+    narrators = set()
+    complete_books = 0
+    for book in author_books:
+        series_name = book.get('series')
+        if series_name:
+            series_data[series_name].append(book)
+        publisher = book.get('publisher')
+        if publisher:
+            publishers.add(publisher)
+        narrator = book.get('narrator')
+        if narrator:
+            if isinstance(narrator, list):
+                narrators.update(narrator)
+            else:
+                narrators.add(narrator)
+        complete_books += is_book_complete(book)
+    narrators.discard('')
+    narrators.discard(None)
+    
+    total_books = len(author_books)
+    # Integer percentage rounded half up
+    completion_percentage = (complete_books * 200 + total_books) // (2 * total_books) if total_books else 0
+    return {
+        "series_data": dict(series_data),
+        "publishers": sorted(publishers),
+        "narrators": sorted(narrators),
+        "stats": {
+            'total_books': total_books,
+            'complete_books': complete_books,
+            'incomplete_books': total_books - complete_books,
+            'completion_percentage': completion_percentage,
+            'total_series': len(series_data),
+            'total_publishers': len(publishers),
+            'total_narrators': len(narrators)
+        }
+    }
+
 def is_book_complete(book: dict) -> bool:
     """Check if a book has all required fields completed"""
+    narrator = book.get('narrator')
     return bool(
+        narrator and
         book.get('title') and
         book.get('series') and
         book.get('publisher') and
-        book.get('narrator') and
-        len(book.get('narrator', [])) > 0 and
-        all(n and n.strip() for n in book.get('narrator', []))
+        all(n and n.strip() for n in narrator)
     )
 
 def transform_audiobooks_for_frontend(data):
@@ -916,66 +1459,16 @@ def transform_audiobooks_for_frontend(data):
     if not data or 'audiobooks' not in data or 'author' not in data['audiobooks']:
         return []
     
-    authors_list = []
-    authors_data = data['audiobooks']['author']
-    
-    for author_name, books in authors_data.items():
-        author_obj = {
-            'name': author_name,
-            'books': books if isinstance(books, list) else []
-        }
-        authors_list.append(author_obj)
-    
-    return authors_list
-
-@app.get("/")
-async def root():
-    """Root route that shows upcoming releases."""
-    try:
-        data = load_audiobooks()
-        # Calculate upcoming audiobooks and stats
-        upcoming = []
-        if 'audiobooks' in data and 'author' in data['audiobooks']:
-            # Flatten all books for all authors
-            for books in data['audiobooks']['author'].values():
-                for book in books:
-                    if book.get('release_date'):
-                        upcoming.append(book)
-        # Optionally, sort by release_date
-        upcoming = sorted(upcoming, key=lambda b: b.get('release_date', ''))
-        stats = get_stats(data)
-        return templates.TemplateResponse("upcoming.html", {
-            "request": {"url": "/"},
-            "upcoming_audiobooks": upcoming,
-            "stats": stats
-        })
-    except Exception as e:
-        print(f"Error in root route: {e}")
-        return templates.TemplateResponse("upcoming.html", {
-            "request": {"url": "/"},
-            "upcoming_audiobooks": [],
-            "stats": {
-                "total_books": 0,
-                "total_authors": 0,
-                "total_publishers": 0,
-                "total_narrators": 0
-            }
-        })
+    return [
+        {'name': author_name, 'books': books if isinstance(books, list) else []}
+        for author_name, books in data['audiobooks']['author'].items()
+    ]
 
 @app.get("/api/ical/download/{asin}")
 async def download_ical(asin: str):
     """Download iCal file for a specific audiobook by ASIN"""
     try:
-        # Get upcoming audiobooks data
-        upcoming_audiobooks = get_upcoming_audiobooks()
-        
-        # Find the audiobook by ASIN
-        audiobook = None
-        for book in upcoming_audiobooks:
-            if book.get('asin') == asin:
-                audiobook = book
-                break
-        
+        audiobook = await asyncio.to_thread(get_upcoming_audiobook, asin)
         if not audiobook:
             raise HTTPException(status_code=404, detail=f"Audiobook with ASIN {asin} not found")
         
@@ -983,7 +1476,7 @@ async def download_ical(asin: str):
         ical_content = create_simple_ical_event(audiobook)
         
         # Prepare filename
-        title = audiobook.get('title', 'audiobook').replace(' ', '_').replace('/', '_')
+        title = (audiobook.get('title') or 'audiobook').translate(ICAL_FILENAME_TABLE)
         filename = f"{title}_{asin}.ics"
         
         return Response(
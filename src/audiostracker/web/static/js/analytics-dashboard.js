@@ -11,19 +11,28 @@ class AnalyticsDashboard {
             return;
         }
 
-        await this.createReleaseTrendChart();
-        await this.createTopAuthorsChart();
-        await this.createUpcomingCountChart();
+        // One request for all charts instead of one per chart
+        const dashboard = await this.fetchDashboard();
+        this.createReleaseTrendChart(dashboard.trends || {});
+        this.createTopAuthorsChart(dashboard.top_authors || {});
+        this.createUpcomingCountChart(dashboard.upcoming_count || {});
     }
 
-    async createReleaseTrendChart() {
+    async fetchDashboard() {
+        try {
+            const response = await fetch('/api/dashboard');
+            return await response.json();
+        } catch (error) {
+            console.error('Failed to load dashboard data:', error);
+            return {};
+        }
+    }
+
+    createReleaseTrendChart(data) {
         const ctx = document.getElementById('release-trend-chart');
         if (!ctx) return;
 
         try {
-            const response = await fetch('/api/analytics/release-trends');
-            const data = await response.json();
-
             this.charts.releaseTrend = new Chart(ctx, {
                 type: 'line',
                 data: {
@@ -56,14 +65,11 @@ class AnalyticsDashboard {
         }
     }
 
-    async createTopAuthorsChart() {
+    createTopAuthorsChart(data) {
         const ctx = document.getElementById('top-authors-chart');
         if (!ctx) return;
 
         try {
-            const response = await fetch('/api/analytics/top-authors');
-            const data = await response.json();
-
             this.charts.topAuthors = new Chart(ctx, {
                 type: 'doughnut',
                 data: {
@@ -98,14 +104,11 @@ class AnalyticsDashboard {
         }
     }
 
-    async createUpcomingCountChart() {
+    createUpcomingCountChart(data) {
         const ctx = document.getElementById('upcoming-count-chart');
         if (!ctx) return;
 
         try {
-            const response = await fetch('/api/analytics/upcoming-count');
-            const data = await response.json();
-
             this.charts.upcomingCount = new Chart(ctx, {
                 type: 'bar',
                 data: {
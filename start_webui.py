@@ -10,6 +10,12 @@ from pathlib import Path
 import yaml
 import logging
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only have the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 # Add the source directory to Python path
 src_dir = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_dir))
@@ -21,7 +27,7 @@ def load_config():
     try:
         if config_file.exists():
             with open(config_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=YamlSafeLoader)
         else:
             print(f"Warning: Config file not found at {config_file}")
             return {}
@@ -49,12 +55,17 @@ def main():
     print(f"🌐 URL: http://{host}:{port}")
     print("-" * 50)
     
-    # Start the web server
+    # Start the web server on uvloop + httptools (installed by uvicorn[standard]);
+    # uvloop is not available on Windows, so fall back to the stock asyncio loop there.
+    # Always a single process: the app keeps a write-behind copy of audiobooks.json in memory,
+    # and separate worker processes would overwrite each other's edits.
     uvicorn.run(
         "audiostracker.web.app:app",
         host=host,
         port=port,
         reload=reload,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
 
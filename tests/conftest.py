@@ -0,0 +1,14 @@
+import os
+import pytest
+
+@pytest.fixture(scope="module")
+def ical_tmpdir(tmp_path_factory):
+    """One iCal export directory shared by every test in a module"""
+    yield str(tmp_path_factory.mktemp("ical"))
+
+@pytest.fixture
+def ical_dir(ical_tmpdir):
+    """Hand out the module's export directory and empty it after each test"""
+    yield ical_tmpdir
+    for entry in os.scandir(ical_tmpdir):
+        os.unlink(entry.path)
@@ -1,41 +1,65 @@
 import pytest
-import tempfile
 import os
-import sys
+from pathlib import Path
 import json
+import sqlite3
+import requests
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'audiostracker'))
-
-from database import (
+# src/ is on the import path via pytest.ini's pythonpath
+from audiostracker import database
+from audiostracker.database import (
     init_db, insert_or_update_audiobook, 
     is_notified_for_channel, mark_notified_for_channel,
     get_unnotified_for_channel, prune_released
 )
-from notify.notify import NotificationDispatcher
-from notify.pushover import PushoverNotifier
-from notify.discord import DiscordNotifier
-from notify.email import EmailNotifier
-from ical_export import ICalExporter
+from audiostracker.notify.notify import NotificationDispatcher
+from audiostracker.notify.pushover import PushoverNotifier
+from audiostracker.notify.discord import DiscordNotifier
+from audiostracker.notify.email import EmailNotifier
+from audiostracker.ical_export import ICalExporter
+
+@pytest.fixture(scope="module")
+def shared_db():
+    """Point the database module at one shared in-memory database for this module"""
+    original_db_file = database.DB_FILE
+    # A named shared-cache database is visible to every get_connection() call, unlike
+    # ':memory:' which gives each connection its own empty database
+    database.DB_FILE = 'file:test_integration?mode=memory&cache=shared'
+    # The shared database only lives while a connection to it is open
+    keeper = sqlite3.connect(database.DB_FILE, uri=True)
+    init_db()
+    yield
+    keeper.close()
+    database.DB_FILE = original_db_file
+
+@pytest.fixture
+def db(shared_db):
+    """Empty audiobooks table for each test; the schema is only created once per module"""
+    yield
+    with database.get_connection() as conn:
+        conn.execute("DELETE FROM audiobooks")
+
+def insert_audiobooks(rows):
+    """Insert test audiobooks in one transaction.
+
+    Each row is (asin, title, author, narrator, publisher, series, series_number, release_date).
+    """
+    with database.get_connection() as conn:
+        conn.executemany("""
+            INSERT OR REPLACE INTO audiobooks (
+                asin, title, author, narrator, publisher, series, series_number, release_date,
+                last_checked, notified_channels
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), '{}')
+        """, rows)
 
+@pytest.mark.xdist_group("db")
+@pytest.mark.usefixtures("db")
 class TestMultiChannelNotifications:
     """Test multi-channel notification support"""
     
-    def setup_method(self):
-        """Set up test database"""
-        # Use in-memory database for testing
-        import database
-        self.original_db_file = database.DB_FILE
-        database.DB_FILE = ':memory:'
-        init_db()
-    
-    def teardown_method(self):
-        """Clean up after tests"""
-        import database
-        database.DB_FILE = self.original_db_file
-    
     def test_notification_channel_tracking(self):
         """Test that notification channels are tracked correctly"""
         # Insert a test audiobook
@@ -70,173 +94,141 @@ class TestMultiChannelNotifications:
     def test_get_unnotified_for_channel(self):
         """Test getting unnotified audiobooks for specific channels"""
         # Insert test audiobooks
-        insert_or_update_audiobook(
-            asin="TEST1",
-            title="Test Book 1",
-            author="Test Author",
-            narrator="Test Narrator",
-            publisher="Test Publisher",
-            series="",
-            series_number="",
-            release_date="2025-12-01"
-        )
+        insert_audiobooks([
+            ("TEST1", "Test Book 1", "Test Author", "Test Narrator", "Test Publisher", "", "", "2025-12-01"),
+            ("TEST2", "Test Book 2", "Test Author", "Test Narrator", "Test Publisher", "", "", "2025-12-02"),
+        ])
         
-        insert_or_update_audiobook(
-            asin="TEST2",
-            title="Test Book 2",
-            author="Test Author",
-            narrator="Test Narrator",
-            publisher="Test Publisher",
-            series="",
-            series_number="",
-            release_date="2025-12-02"
-        )
-        
-        # Initially both should be unnotified for all channels
-        pushover_unnotified = get_unnotified_for_channel("pushover")
-        discord_unnotified = get_unnotified_for_channel("discord")
-        
-        assert len(pushover_unnotified) == 2
-        assert len(discord_unnotified) == 2
-        
-        # Mark one as notified for pushover
+        # Mark one as notified for pushover; discord has no notifications yet
         mark_notified_for_channel("TEST1", "pushover")
         
         pushover_unnotified = get_unnotified_for_channel("pushover")
         discord_unnotified = get_unnotified_for_channel("discord")
         
-        assert len(pushover_unnotified) == 1  # Only TEST2
-        assert len(discord_unnotified) == 2   # Both still unnotified for discord
-        assert pushover_unnotified[0]['asin'] == "TEST2"
+        assert [book['asin'] for book in pushover_unnotified] == ["TEST2"]
+        assert {book['asin'] for book in discord_unnotified} == {"TEST1", "TEST2"}
+
+DISPATCHER_CONFIG = {
+    'pushover': {'enabled': True, 'user_key': 'test', 'api_token': 'test'},
+    'discord': {'enabled': True, 'webhook_url': 'https://discord.com/webhook'},
+    'email': {'enabled': False}
+}
+
+@pytest.fixture(scope="class")
+def dispatcher():
+    """One dispatcher with mocked notifier classes, shared by a test class"""
+    with patch('audiostracker.notify.notify.PushoverNotifier'), \
+         patch('audiostracker.notify.notify.DiscordNotifier'):
+        yield NotificationDispatcher(DISPATCHER_CONFIG)
 
 class TestNotificationDispatcher:
     """Test the notification dispatcher"""
     
-    def test_initialize_channels(self):
+    def test_initialize_channels(self, dispatcher):
         """Test channel initialization"""
-        config = {
-            'pushover': {'enabled': True, 'user_key': 'test', 'api_token': 'test'},
-            'discord': {'enabled': True, 'webhook_url': 'https://discord.com/webhook'},
-            'email': {'enabled': False}
-        }
+        enabled_channels = dispatcher.get_enabled_channels()
         
-        with patch('notify.pushover.PushoverNotifier'), \
-             patch('notify.discord.DiscordNotifier'):
-            dispatcher = NotificationDispatcher(config)
-            enabled_channels = dispatcher.get_enabled_channels()
-            
-            assert 'pushover' in enabled_channels
-            assert 'discord' in enabled_channels
-            assert 'email' not in enabled_channels
+        assert 'pushover' in enabled_channels
+        assert 'discord' in enabled_channels
+        assert 'email' not in enabled_channels
     
-    @patch('notify.pushover.PushoverNotifier')
-    def test_send_notification_success(self, mock_pushover):
+    def test_send_notification_success(self, dispatcher):
         """Test successful notification sending"""
-        config = {
-            'pushover': {'enabled': True, 'user_key': 'test', 'api_token': 'test'}
-        }
-        
-        mock_notifier = MagicMock()
+        mock_notifier = dispatcher.channels['pushover']
+        mock_notifier.reset_mock()
         mock_notifier.send_digest.return_value = True
-        mock_pushover.return_value = mock_notifier
         
-        dispatcher = NotificationDispatcher(config)
         audiobooks = [{'title': 'Test Book', 'author': 'Test Author'}]
         
         result = dispatcher.send_notification('pushover', audiobooks)
         assert result is True
         mock_notifier.send_digest.assert_called_once_with(audiobooks)
 
+# 5 audiobooks to test batching, as the rows and cursor description the mocked DB returns
+_BATCH_COLUMNS = ('title', 'author', 'narrator', 'publisher', 'series', 'series_number', 'release_date', 'asin')
+_BATCH_ROWS = [
+    (f'Test Book {i}', 'Test Author', 'Test Narrator', 'Test Publisher', '', '', f'2025-12-0{i}', f'TEST{i}')
+    for i in range(1, 6)
+]
+_BATCH_DESCRIPTION = [(key, None) for key in _BATCH_COLUMNS]
+
 class TestICalExport:
     """Test iCal export functionality"""
     
-    def test_ical_export_creation(self):
+    def test_ical_export_creation(self, ical_dir):
         """Test basic iCal export functionality"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = {
-                'ical': {
-                    'enabled': True,
-                    'file_path': temp_dir,
-                    'batch': {'enabled': False, 'max_books': 10}
-                }
+        config = {
+            'ical': {
+                'enabled': True,
+                'file_path': ical_dir,
+                'batch': {'enabled': False, 'max_books': 10}
             }
-            
-            exporter = ICalExporter(config)
-            
-            audiobooks = [{
-                'title': 'Test Book',
-                'author': 'Test Author',
-                'narrator': 'Test Narrator',
-                'publisher': 'Test Publisher',
-                'series': 'Test Series',
-                'series_number': '1',
-                'release_date': '2025-12-01',
-                'asin': 'TEST123'
-            }]
-            
-            file_path = exporter.export_audiobooks(audiobooks, 'test_export')
-            
-            assert os.path.exists(file_path)
-            assert file_path.endswith('test_export.ics')
-            
-            # Check file contents
-            with open(file_path, 'r') as f:
-                content = f.read()
-                assert 'BEGIN:VCALENDAR' in content
-                assert 'END:VCALENDAR' in content
-                assert 'Test Book' in content
-                assert 'Test Author' in content
-                assert 'audiobook-TEST123' in content
+        }
+        
+        exporter = ICalExporter(config)
+        
+        audiobooks = [{
+            'title': 'Test Book',
+            'author': 'Test Author',
+            'narrator': 'Test Narrator',
+            'publisher': 'Test Publisher',
+            'series': 'Test Series',
+            'series_number': '1',
+            'release_date': '2025-12-01',
+            'asin': 'TEST123'
+        }]
+        
+        file_path = exporter.export_audiobooks(audiobooks, 'test_export')
+        
+        assert os.path.exists(file_path)
+        assert file_path.endswith('test_export.ics')
+        
+        # Check file contents
+        content = Path(file_path).read_bytes()
+        assert b'BEGIN:VCALENDAR' in content
+        assert b'END:VCALENDAR' in content
+        assert b'Test Book' in content
+        assert b'Test Author' in content
+        assert b'audiobook-TEST123' in content
     
-    def test_ical_batch_export(self):
+    def test_ical_batch_export(self, ical_dir):
         """Test batch export functionality"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = {
-                'ical': {
-                    'enabled': True,
-                    'file_path': temp_dir,
-                    'batch': {'enabled': True, 'max_books': 2}
-                }
+        config = {
+            'ical': {
+                'enabled': True,
+                'file_path': ical_dir,
+                'batch': {'enabled': True, 'max_books': 2}
             }
+        }
+        
+        exporter = ICalExporter(config)
+        
+        # Mock database connection for batch export
+        with patch('audiostracker.ical_export.get_connection') as mock_conn:
+            mock_cursor = MagicMock()
+            mock_cursor.fetchall.return_value = _BATCH_ROWS
+            mock_cursor.description = _BATCH_DESCRIPTION
+            mock_conn.return_value.__enter__.return_value.cursor.return_value = mock_cursor
             
-            exporter = ICalExporter(config)
+            exported_files = exporter.export_batches()
             
-            # Create 5 audiobooks to test batching
-            audiobooks = []
-            for i in range(5):
-                audiobooks.append({
-                    'title': f'Test Book {i+1}',
-                    'author': 'Test Author',
-                    'narrator': 'Test Narrator',
-                    'publisher': 'Test Publisher',
-                    'series': '',
-                    'series_number': '',
-                    'release_date': f'2025-12-0{i+1}',
-                    'asin': f'TEST{i+1}'
-                })
+            # Should create 3 batches (2, 2, 1)
+            assert len(exported_files) == 3
             
-            # Mock database connection for batch export
-            with patch('ical_export.get_connection') as mock_conn:
-                mock_cursor = MagicMock()
-                mock_cursor.fetchall.return_value = [tuple(book.values()) for book in audiobooks]
-                mock_cursor.description = [(key, None) for key in audiobooks[0].keys()]
-                mock_conn.return_value.__enter__.return_value.cursor.return_value = mock_cursor
-                
-                exported_files = exporter.export_batches()
-                
-                # Should create 3 batches (2, 2, 1)
-                assert len(exported_files) == 3
-                
-                # Check that files exist
-                for file_path in exported_files:
-                    assert os.path.exists(file_path)
+            # Check that files exist
+            for file_path in exported_files:
+                assert os.path.exists(file_path)
 
 class TestRetryLogic:
     """Test retry logic and error handling"""
     
+    @patch('audiostracker.utils.time.sleep', lambda *_: None)
     @patch('requests.post')
-    def test_pushover_retry_on_failure(self, mock_post):
+    def test_pushover_retry_on_failure(self, mock_post, monkeypatch):
         """Test that Pushover retries on failure"""
+        # PushoverNotifier reads its credentials from the environment
+        monkeypatch.setenv('PUSHOVER_USER_KEY', 'test_user')
+        monkeypatch.setenv('PUSHOVER_API_TOKEN', 'test_token')
         config = {
             'user_key': 'test_user',
             'api_token': 'test_token'
@@ -244,8 +236,8 @@ class TestRetryLogic:
         
         # Simulate failure followed by success
         mock_post.side_effect = [
-            Exception("Network error"),
-            Exception("Network error"),
+            requests.ConnectionError("Network error"),
+            requests.ConnectionError("Network error"),
             MagicMock(status_code=200, json=lambda: {'status': 1})
         ]
         
@@ -257,6 +249,7 @@ class TestRetryLogic:
         assert result is True
         assert mock_post.call_count == 3
     
+    @patch('audiostracker.utils.time.sleep', lambda *_: None)
     @patch('requests.post')
     def test_discord_retry_on_failure(self, mock_post):
         """Test that Discord retries on failure"""
@@ -266,7 +259,7 @@ class TestRetryLogic:
         
         # Simulate failure followed by success
         mock_post.side_effect = [
-            Exception("Network error"),
+            requests.ConnectionError("Network error"),
             MagicMock(status_code=200)
         ]
         
@@ -277,63 +270,27 @@ class TestRetryLogic:
         assert result is True
         assert mock_post.call_count == 2
 
+@pytest.mark.xdist_group("db")
+@pytest.mark.usefixtures("db")
 class TestDatabasePruning:
     """Test database pruning functionality"""
     
-    def setup_method(self):
-        """Set up test database"""
-        import database
-        self.original_db_file = database.DB_FILE
-        database.DB_FILE = ':memory:'
-        init_db()
-    
-    def teardown_method(self):
-        """Clean up after tests"""
-        import database
-        database.DB_FILE = self.original_db_file
-    
     def test_prune_released_audiobooks(self):
         """Test that released audiobooks are pruned correctly"""
         # Insert audiobooks with different release dates
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        today = datetime.now().strftime('%Y-%m-%d')
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        
-        # Old audiobook (should be pruned)
-        insert_or_update_audiobook(
-            asin="OLD1",
-            title="Old Book",
-            author="Test Author",
-            narrator="Test Narrator",
-            publisher="Test Publisher",
-            series="",
-            series_number="",
-            release_date=yesterday
-        )
-        
-        # Today's audiobook (should be pruned)
-        insert_or_update_audiobook(
-            asin="TODAY1",
-            title="Today Book",
-            author="Test Author",
-            narrator="Test Narrator",
-            publisher="Test Publisher",
-            series="",
-            series_number="",
-            release_date=today
+        now = datetime.now()
+        yesterday, today, tomorrow = (
+            (now + timedelta(days=offset)).strftime('%Y-%m-%d') for offset in (-1, 0, 1)
         )
         
-        # Future audiobook (should be kept)
-        insert_or_update_audiobook(
-            asin="FUTURE1",
-            title="Future Book",
-            author="Test Author",
-            narrator="Test Narrator",
-            publisher="Test Publisher",
-            series="",
-            series_number="",
-            release_date=tomorrow
-        )
+        insert_audiobooks([
+            # Old audiobook (should be pruned)
+            ("OLD1", "Old Book", "Test Author", "Test Narrator", "Test Publisher", "", "", yesterday),
+            # Today's audiobook (should be pruned)
+            ("TODAY1", "Today Book", "Test Author", "Test Narrator", "Test Publisher", "", "", today),
+            # Future audiobook (should be kept)
+            ("FUTURE1", "Future Book", "Test Author", "Test Narrator", "Test Publisher", "", "", tomorrow),
+        ])
         
         # Run pruning
         deleted_count = prune_released()